@@ -8,13 +8,17 @@ Telegram summary notification at end of dispatch.
 import math
 import os
 import random
+import re
 import secrets
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Callable, Iterable, Optional
 
+import requests as _rq
+
 
 def _broadcast_ref_token() -> str:
     """6-char URL-safe random token for per-message byte-uniqueness."""
@@ -45,6 +49,19 @@ def _broadcast_delay_range() -> tuple[float, float]:
     return lo, hi
 
 
+def _broadcast_concurrency() -> int:
+    """Returns how many sends go out together per throttle window.
+
+    Defaults to 1 (strictly serial, the anti-spam baseline). Raising it
+    multiplies the effective send rate, so it is clamped to [1, 10].
+    """
+    try:
+        value = int(os.environ.get("BROADCAST_CONCURRENCY", "1"))
+    except (TypeError, ValueError):
+        return 1
+    return max(1, min(value, 10))
+
+
 def _rate_limit_sleep() -> float:
     """Returns extra seconds to sleep after a 429 / rate-limit response.
     Validates non-numeric / NaN / inf to defaults; clamps to [0, 600s]."""
@@ -57,6 +74,23 @@ def _rate_limit_sleep() -> float:
     return max(0.0, min(value, 600.0))  # 10-minute hard ceiling
 
 
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    """Seconds from a 429's Retry-After header (delta-seconds form only).
+    None when absent/unparseable; clamped to the same 600s ceiling."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    raw = headers.get("Retry-After") if headers else None
+    if not isinstance(raw, str):
+        return None
+    try:
+        value = float(raw)
+    except ValueError:
+        return None
+    if not math.isfinite(value):
+        return None
+    return max(0.0, min(value, 600.0))
+
+
 class SendErrorCategory(Enum):
     """Categories of send failures. Used for alert grouping, action hints,
     circuit breaker decisions, and Sentry tagging."""
@@ -107,6 +141,11 @@ _FATAL_CATEGORIES = frozenset({
 
 _CIRCUIT_BREAKER_THRESHOLD = 5
 
+# Body-text hints for classify_error, one alternation per category so each
+# reason string is scanned once by the regex engine (matched on lowercased text).
+_DISCONNECTED_HINTS_RE = re.compile(r"disconnected|not connected")
+_INVALID_NUMBER_HINTS_RE = re.compile(r"not registered|invalid number|not on whatsapp")
+
 # Per-category how many sample contact names to show inline (0 = none, show count only)
 _CATEGORY_SAMPLE_LIMIT = 3
 
@@ -126,6 +165,7 @@ class DeliveryResult:
     error: Optional[str]
     duration_ms: int
     category: SendErrorCategory = SendErrorCategory.UNKNOWN
+    retry_after: Optional[float] = None  # provider's Retry-After on a 429
 
 
 @dataclass
@@ -183,8 +223,6 @@ def classify_error(exc: Exception) -> tuple[SendErrorCategory, str]:
     The reason is a short, human-readable string suitable for the Telegram alert.
     The category drives action hints, grouping, and circuit breaker behavior.
     """
-    import requests as _rq
-
     if isinstance(exc, _rq.Timeout):
         return SendErrorCategory.TIMEOUT, "timeout"
 
@@ -203,9 +241,9 @@ def classify_error(exc: Exception) -> tuple[SendErrorCategory, str]:
             return SendErrorCategory.AUTH, reason_str or f"HTTP {status}"
         if status == 429 or ("rate" in reason_lower and "limit" in reason_lower):
             return SendErrorCategory.RATE_LIMIT, reason_str or f"HTTP {status}"
-        if "disconnected" in reason_lower or "not connected" in reason_lower:
+        if _DISCONNECTED_HINTS_RE.search(reason_lower):
             return SendErrorCategory.WHATSAPP_DISCONNECTED, reason_str
-        if status == 400 and ("not registered" in reason_lower or "invalid number" in reason_lower or "not on whatsapp" in reason_lower):
+        if status == 400 and _INVALID_NUMBER_HINTS_RE.search(reason_lower):
             return SendErrorCategory.INVALID_NUMBER, reason_str
         if 500 <= status < 600:
             return SendErrorCategory.UPSTREAM_5XX, reason_str or f"HTTP {status}"
@@ -224,7 +262,6 @@ def _categorize_error(exc: Exception, reason: Optional[str] = None) -> str:
     `_extract_http_reason`. Falls back to truncated raw body when no structured
     reason is available, preserving historical dashboard behavior.
     """
-    import requests as _rq
     if isinstance(exc, _rq.Timeout):
         return "timeout"
     if isinstance(exc, _rq.HTTPError) and exc.response is not None:
@@ -330,6 +367,15 @@ def _build_telegram_client():
     return TelegramClient()
 
 
+# Column priority for legacy sheet rows, first truthy value wins.
+_NAME_COLUMNS = ("ProfileName", "Nome", "Name")
+_PHONE_COLUMNS = ("Evolution-api", "n8n-evo", "Telefone", "Phone", "From")
+
+
+def _first_present(row: dict, columns: tuple):
+    return next((v for v in map(row.get, columns) if v), None)
+
+
 def build_contact_from_row(row: dict) -> Optional[Contact]:
     """
     Convert a Google Sheets row dict into a Contact.
@@ -338,19 +384,8 @@ def build_contact_from_row(row: dict) -> Optional[Contact]:
     Priority for phone: Evolution-api > n8n-evo > Telefone > Phone > From.
     Phone normalization: strip "whatsapp:", "+", "@s.whatsapp.net".
     """
-    name = (
-        row.get("ProfileName")
-        or row.get("Nome")
-        or row.get("Name")
-        or "—"
-    )
-    raw_phone = (
-        row.get("Evolution-api")
-        or row.get("n8n-evo")
-        or row.get("Telefone")
-        or row.get("Phone")
-        or row.get("From")
-    )
+    name = _first_present(row, _NAME_COLUMNS) or "—"
+    raw_phone = _first_present(row, _PHONE_COLUMNS)
     if not raw_phone:
         return None
     phone = (
@@ -419,82 +454,89 @@ class DeliveryReporter:
         # Cache throttle config once per dispatch — env vars don't change mid-run,
         # and this avoids re-parsing on every iteration.
         delay_lo, delay_hi = _broadcast_delay_range()
+        concurrency = _broadcast_concurrency()
+        pool = ThreadPoolExecutor(max_workers=concurrency) if concurrency > 1 else None
+        # AIMD: a rate-limited wave halves the wave size, each clean wave
+        # grows it back by one, never above the configured ceiling.
+        wave_size = concurrency
 
-        for i, contact in enumerate(contacts_list):
-            if circuit_tripped:
-                result = DeliveryResult(
-                    contact=contact,
-                    success=False,
-                    error="skipped_due_to_circuit_break",
-                    duration_ms=0,
-                    category=SendErrorCategory.SKIPPED_CIRCUIT_BREAK,
-                )
-                results.append(result)
-                if on_progress is not None:
-                    try:
-                        on_progress(i + 1, total, result)
-                    except Exception:
-                        pass
-                continue
-
-            t0 = time.monotonic()
-            success = False
-            error: Optional[str] = None
-            category: SendErrorCategory = SendErrorCategory.UNKNOWN
-            outgoing = message
-            if _ref_token_enabled():
-                outgoing = f"{message}\n\nRef: {_broadcast_ref_token()}"
-            try:
-                self.send_fn(contact.phone, outgoing)
-                success = True
-            except Exception as exc:
-                category, reason = classify_error(exc)
-                error = _categorize_error(exc, reason)  # single JSON parse; legacy string for dashboard JSON
-                self._capture_sentry(exc, category)
-            duration_ms = int((time.monotonic() - t0) * 1000)
-
-            result = DeliveryResult(
-                contact=contact,
-                success=success,
-                error=error,
-                duration_ms=duration_ms,
-                category=category,
-            )
-            results.append(result)
-
-            # Circuit breaker bookkeeping
-            if success:
-                streak_category = None
-                streak_count = 0
-            else:
-                if category == streak_category:
-                    streak_count += 1
-                else:
-                    streak_category = category
-                    streak_count = 1
-                if (
-                    streak_count >= self.circuit_breaker_threshold
-                    and streak_category in self.fatal_categories
-                ):
-                    circuit_tripped = True
-
+        def _progress(result: DeliveryResult) -> None:
             if on_progress is not None:
                 try:
-                    on_progress(i + 1, total, result)
+                    on_progress(len(results), total, result)
                 except Exception:
                     pass  # progress callback failures do not abort dispatch
 
-            # Throttle: sleep between sends to avoid spam-velocity classifiers.
-            # Skip after the last contact, and skip when the contact was
-            # circuit-broken (no API call was made).
-            is_last = (i == total - 1)
-            was_attempted = not (
-                circuit_tripped and result.category == SendErrorCategory.SKIPPED_CIRCUIT_BREAK
-            )
-            if not is_last and was_attempted:
-                if (not success) and category == SendErrorCategory.RATE_LIMIT:
-                    time.sleep(_rate_limit_sleep())
-                time.sleep(random.uniform(delay_lo, delay_hi))
+        try:
+            i = 0
+            while i < total:
+                if circuit_tripped:
+                    result = DeliveryResult(
+                        contact=contacts_list[i],
+                        success=False,
+                        error="skipped_due_to_circuit_break",
+                        duration_ms=0,
+                        category=SendErrorCategory.SKIPPED_CIRCUIT_BREAK,
+                    )
+                    results.append(result)
+                    _progress(result)
+                    i += 1
+                    continue
+
+                # One wave = up to `wave_size` sends in flight, then one
+                # throttle sleep. With the default of 1 this is the plain
+                # serial loop: send, sleep, send.
+                wave = contacts_list[i:i + wave_size]
+                if pool is None:
+                    wave_results = [self._send_one(c, message) for c in wave]
+                else:
+                    wave_results = list(pool.map(lambda c: self._send_one(c, message), wave))
+                i += len(wave)
+
+                rate_limit_wait: Optional[float] = None
+                for result in wave_results:
+                    results.append(result)
+                    if result.category == SendErrorCategory.RATE_LIMIT:
+                        # Provider's Retry-After wins; otherwise the configured backoff.
+                        wait = result.retry_after if result.retry_after is not None else _rate_limit_sleep()
+                        rate_limit_wait = max(rate_limit_wait or 0.0, wait)
+
+                    # Circuit breaker bookkeeping
+                    if result.success:
+                        streak_category = None
+                        streak_count = 0
+                    else:
+                        if result.category == streak_category:
+                            streak_count += 1
+                        else:
+                            streak_category = result.category
+                            streak_count = 1
+                        if (
+                            streak_count >= self.circuit_breaker_threshold
+                            and streak_category in self.fatal_categories
+                        ):
+                            circuit_tripped = True
+
+                    _progress(result)
+
+                if rate_limit_wait is not None:
+                    wave_size = max(1, wave_size // 2)
+                elif wave_size < concurrency:
+                    wave_size += 1
+
+                # Throttle: sleep between sends to avoid spam-velocity classifiers.
+                # Skip after the last contact; circuit-broken contacts never
+                # reach this point (no API call was made).
+                # The jitter is a send-to-send interval, so time already spent
+                # on the wire (slowest send of the wave) comes off the budget.
+                if i < total:
+                    if rate_limit_wait is not None:
+                        time.sleep(rate_limit_wait)
+                    spent = max(r.duration_ms for r in wave_results) / 1000
+                    time.sleep(max(0.0, random.uniform(delay_lo, delay_hi) - spent))
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
 
         finished_at = datetime.now().astimezone()
         report = DeliveryReport(
@@ -509,6 +551,34 @@ class DeliveryReporter:
             self._send_telegram_summary(report)
         return report
 
+    def _send_one(self, contact: Contact, message: str) -> DeliveryResult:
+        """Send to a single contact and classify the outcome. Never raises."""
+        t0 = time.monotonic()
+        success = False
+        error: Optional[str] = None
+        category: SendErrorCategory = SendErrorCategory.UNKNOWN
+        retry_after: Optional[float] = None
+        outgoing = message
+        if _ref_token_enabled():
+            outgoing = f"{message}\n\nRef: {_broadcast_ref_token()}"
+        try:
+            self.send_fn(contact.phone, outgoing)
+            success = True
+        except Exception as exc:
+            category, reason = classify_error(exc)
+            error = _categorize_error(exc, reason)  # single JSON parse; legacy string for dashboard JSON
+            self._capture_sentry(exc, category)
+            if category == SendErrorCategory.RATE_LIMIT:
+                retry_after = _retry_after_seconds(exc)
+        return DeliveryResult(
+            contact=contact,
+            success=success,
+            error=error,
+            duration_ms=int((time.monotonic() - t0) * 1000),
+            category=category,
+            retry_after=retry_after,
+        )
+
     @staticmethod
     def _emit_delivery_summary_event(report: "DeliveryReport") -> None:
         """Emit a single `delivery_summary` event to the active EventBus so the
@@ -540,6 +610,7 @@ class DeliveryReporter:
                     "failure": report.failure_count,
                     "delay_min": lo,
                     "delay_max": hi,
+                    "concurrency": _broadcast_concurrency(),
                     "duration_seconds": duration,
                 },
                 level=level,
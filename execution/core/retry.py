@@ -12,6 +12,7 @@ Usage:
 """
 
 import time
+import random
 import functools
 from typing import Callable, Optional, Type, Tuple, Any
 
@@ -22,7 +23,9 @@ def retry_with_backoff(
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
-    on_retry: Optional[Callable[[Exception, int], None]] = None
+    on_retry: Optional[Callable[[Exception, int], None]] = None,
+    jitter: float = 0.0,
+    retry_if: Optional[Callable[[Exception], bool]] = None
 ):
     """
     Decorator for retrying functions with exponential backoff.
@@ -34,6 +37,10 @@ def retry_with_backoff(
         exponential_base: Base for exponential backoff (delay = base_delay * exponential_base^attempt)
         exceptions: Tuple of exception types to catch and retry
         on_retry: Optional callback function(exception, attempt) called on each retry
+        jitter: Extra random delay in [0, jitter] seconds added to each wait, so
+            parallel callers don't retry in lockstep
+        retry_if: Optional predicate; when it returns False the exception is
+            re-raised immediately (e.g. a permanent 4xx)
     
     Returns:
         Decorated function with retry logic
@@ -57,12 +64,17 @@ def retry_with_backoff(
                     if attempt == max_attempts:
                         # Last attempt failed, raise the exception
                         raise
+
+                    if retry_if is not None and not retry_if(e):
+                        raise
                     
                     # Calculate delay with exponential backoff
                     delay = min(
                         base_delay * (exponential_base ** (attempt - 1)),
                         max_delay
                     )
+                    if jitter:
+                        delay += random.uniform(0, jitter)
                     
                     # Call retry callback if provided
                     if on_retry:
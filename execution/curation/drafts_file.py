@@ -0,0 +1,94 @@
+"""Local draft store: data/news_drafts.json.
+
+Written by rationale_dispatcher and scripts/manual_ingestion_json, read and
+rewritten by the dashboard (dashboard/app/api/news/route.ts). The file stays
+a single JSON array because the dashboard parses it with JSON.parse — an
+append-only JSONL file would be cheaper per write but unreadable there.
+
+Writers serialize on an flock'd sidecar (`news_drafts.json.lock`) and swap
+the new array in with os.replace, so two overlapping runs (manual + cron)
+can't drop each other's draft and a crash mid-write never leaves a
+half-written file behind.
+"""
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+DRAFTS_FILE = Path(__file__).resolve().parents[2] / "data" / "news_drafts.json"
+
+
+def load_drafts(path=DRAFTS_FILE) -> list:
+    """Return the drafts array. Missing or corrupt file -> []."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            drafts = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, ValueError):
+        return []
+    return drafts if isinstance(drafts, list) else []
+
+
+@contextmanager
+def _exclusive_lock(path: Path):
+    fd = os.open(f"{path}.lock", os.O_WRONLY | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def _write_atomic(path: Path, drafts: list) -> None:
+    # mkstemp creates 0600; keep the current file's mode (0644 for a new
+    # one) so the dashboard, running as another user, can still read it.
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), mode)
+            f.write(json.dumps(drafts, indent=2, ensure_ascii=False).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _quarantine_corrupt(path: Path) -> None:
+    """Move an unparseable drafts file aside instead of overwriting it, so
+    whatever the dashboard (non-atomic writer) left behind can be recovered.
+    Timestamped, so an earlier quarantined copy is never replaced."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            json.load(f)
+    except FileNotFoundError:
+        return
+    except (json.JSONDecodeError, ValueError):
+        stamp = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+        os.replace(path, f"{path}.corrupt.{stamp}")
+
+
+def append_draft(draft: dict, path=DRAFTS_FILE) -> None:
+    """Append one draft. Safe across concurrent processes on the same host."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _exclusive_lock(path):
+        drafts = load_drafts(path)
+        if not drafts:
+            _quarantine_corrupt(path)
+        drafts.append(draft)
+        _write_atomic(path, drafts)
@@ -8,6 +8,7 @@ v2: dropped source from hash — same article appears in multiple Platts pages
 """
 import hashlib
 import re
+from functools import lru_cache
 
 _CURLY_QUOTES = str.maketrans("\u2018\u2019\u201c\u201d", "''\"\"")
 _TRAILING_PUNCT_RE = re.compile(r"[.,;]+$")
@@ -21,6 +22,13 @@ def normalize_title(title: str) -> str:
     """
     if not title or not isinstance(title, str):
         raise ValueError("title must be a non-empty string")
+    return _normalize_str(title)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_str(title: str) -> str:
+    # Cached: the same headline shows up on several Platts pages per run
+    # (Latest, Top News, topic grids) and again in rebuild_dedup sweeps.
     result = title.strip().lower()
     result = _WHITESPACE_RE.sub(" ", result)
     result = result.translate(_CURLY_QUOTES)
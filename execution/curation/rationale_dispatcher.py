@@ -7,37 +7,41 @@ porque pode ser útil como utilitário chamado manualmente via script
 ou como base pra uma fase futura de prompts dedicados de rationale.
 Revisitar pra possível remoção quando essa decisão for tomada.
 """
-import json
 import os
 from datetime import datetime
 from typing import List
 
+import requests
+
 from execution.agents.rationale_agent import RationaleAgent
 from execution.core import state_store
 from execution.core.logger import WorkflowLogger
+from execution.curation.drafts_file import append_draft
 from execution.integrations.telegram_client import TelegramClient
 
 _WORKFLOW_NAME = "rationale_news"
-_DRAFTS_FILE = os.path.join(os.path.dirname(__file__), "..", "..", "data", "news_drafts.json")
-
-
-# NOT concurrency-safe — assumes cron serialization. Do not call from
-# overlapping processes.
-def _save_draft(draft: dict) -> None:
-    """Append draft to news_drafts.json."""
-    drafts_path = os.path.abspath(_DRAFTS_FILE)
-    os.makedirs(os.path.dirname(drafts_path), exist_ok=True)
-    if os.path.exists(drafts_path):
-        with open(drafts_path, "r") as f:
-            try:
-                drafts = json.load(f)
-            except (json.JSONDecodeError, ValueError):
-                drafts = []
-    else:
-        drafts = []
-    drafts.append(draft)
-    with open(drafts_path, "w") as f:
-        json.dump(drafts, f, indent=2, ensure_ascii=False)
+
+
+def _store_draft(webhook_url: str, draft_id: str, message: str, log: WorkflowLogger) -> None:
+    """POST the draft to the webhook's /store-draft. Never raises."""
+    try:
+        resp = requests.post(
+            f"{webhook_url}/store-draft",
+            json={
+                "draft_id": draft_id,
+                "message": message,
+                "uazapi_token": os.getenv("UAZAPI_TOKEN", ""),
+                "uazapi_url": os.getenv("UAZAPI_URL", "https://mineralstrading.uazapi.com"),
+                "workflow_type": "rationale_news",
+                "direct_delivery": False,
+            },
+            headers={"X-Webhook-Secret": os.getenv("WEBHOOK_SHARED_SECRET", "")},
+            timeout=10,
+        )
+        if resp.status_code != 200:
+            log.warning(f"Webhook store-draft returned HTTP {resp.status_code}")
+    except Exception as exc:
+        log.warning(f"Could not store draft on webhook: {exc}")
 
 
 def process(rationale_items: List[dict], today_br: str, logger: WorkflowLogger = None) -> bool:
@@ -87,32 +91,16 @@ def process(rationale_items: List[dict], today_br: str, logger: WorkflowLogger =
         "ai_text": draft_text,
         "source_summary": (rationale_items[0].get("title") or "Sem Título") + "...",
     }
-    _save_draft(draft_obj)
+    append_draft(draft_obj)
     log.info("Draft saved.")
 
     webhook_url = os.getenv("TELEGRAM_WEBHOOK_URL", "")
     # Best-effort: webhook store is only needed for Telegram-button approvals.
     # Dashboard approval works without it, so we tolerate failures.
+    # Stored before the approval goes out: a button tapped as soon as the
+    # message lands must find the draft.
     if webhook_url:
-        import requests
-        try:
-            resp = requests.post(
-                f"{webhook_url}/store-draft",
-                json={
-                    "draft_id": draft_obj["id"],
-                    "message": draft_text,
-                    "uazapi_token": os.getenv("UAZAPI_TOKEN", ""),
-                    "uazapi_url": os.getenv("UAZAPI_URL", "https://mineralstrading.uazapi.com"),
-                    "workflow_type": "rationale_news",
-                    "direct_delivery": False,
-                },
-                headers={"X-Webhook-Secret": os.getenv("WEBHOOK_SHARED_SECRET", "")},
-                timeout=10,
-            )
-            if resp.status_code != 200:
-                log.warning(f"Webhook store-draft returned HTTP {resp.status_code}")
-        except Exception as exc:
-            log.warning(f"Could not store draft on webhook: {exc}")
+        _store_draft(webhook_url, draft_obj["id"], draft_text, log)
 
     telegram = TelegramClient()
     telegram.send_approval_request(draft_id=draft_obj["id"], preview_text=draft_text)
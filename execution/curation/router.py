@@ -29,12 +29,12 @@ def classify(item: dict) -> str:
     return "curation"
 
 
-def _type_tag(item: dict) -> str:
-    """Return the staging type tag: 'rationale' → 'rationale', else 'news'."""
-    return "rationale" if classify(item) == "rationale" else "news"
+def _type_tag(kind: str) -> str:
+    """Map a classify() result to the staging type tag: 'rationale' → 'rationale', else 'news'."""
+    return "rationale" if kind == "rationale" else "news"
 
 
-def _dedup_title(item: dict, today_date: str) -> str:
+def _dedup_title(item: dict, today_date: str, kind: Optional[str] = None) -> str:
     """Título usado no hash de dedup.
 
     Rationale e Market Commentary têm títulos que se REPETEM entre dias
@@ -45,7 +45,9 @@ def _dedup_title(item: dict, today_date: str) -> str:
     """
     title = item.get("title", "")
     source = item.get("source") or ""
-    if classify(item) == "rationale" or source == "topic.MarketCommentary":
+    if kind is None:
+        kind = classify(item)
+    if kind == "rationale" or source == "topic.MarketCommentary":
         return f"{title}|{today_date}"
     return title
 
@@ -95,9 +97,10 @@ def route_items(
     staged: List[dict] = []
 
     for item in items:
-        item_type = _type_tag(item)
+        kind = classify(item)  # once per item; feeds both the type tag and the dedup salt
+        item_type = _type_tag(kind)
         try:
-            item_id = generate_id(_dedup_title(item, today_date))
+            item_id = generate_id(_dedup_title(item, today_date, kind))
         except ValueError:
             counters["skipped_invalid"] += 1
             log.warning(f"Skipped item with empty/invalid title: {item.get('source', '?')}")
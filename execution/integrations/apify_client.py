@@ -49,14 +49,20 @@ class ApifyClient:
             self.logger.error(f"Apify execution failed: {str(e)}")
             raise e
         
+    def iter_dataset_items(self, dataset_id):
+        """
+        Yields items from a dataset page by page (SDK pagination), so callers
+        that only need one pass never hold the whole dataset in memory.
+        """
+        self.logger.info(f"Streaming dataset {dataset_id}...")
+        count = 0
+        for item in self.client.dataset(dataset_id).iterate_items():
+            count += 1
+            yield item
+        self.logger.info(f"Streamed {count} items from dataset.")
+
     def get_dataset_items(self, dataset_id):
         """
         Retrieves items from a dataset.
         """
-        self.logger.info(f"Fetching dataset {dataset_id}...")
-        
-        dataset = self.client.dataset(dataset_id)
-        items = list(dataset.iterate_items())
-        
-        self.logger.info(f"Retrieved {len(items)} items from dataset.")
-        return items
+        return list(self.iter_dataset_items(dataset_id))
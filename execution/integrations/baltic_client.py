@@ -1,9 +1,25 @@
 
 import os
+import tempfile
 import requests
 import msal
 from datetime import datetime, timedelta
 
+# PDFs are spooled instead of held as one bytes object: small ones stay in
+# memory, anything past 1 MiB spills to a temp file.
+_PDF_SPOOL_MAX_BYTES = 1024 * 1024
+_DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+
+def _spool_response(response):
+    """Copy a streamed response body into a rewound SpooledTemporaryFile."""
+    spool = tempfile.SpooledTemporaryFile(max_size=_PDF_SPOOL_MAX_BYTES)
+    for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_BYTES):
+        spool.write(chunk)
+    size = spool.tell()
+    spool.seek(0)
+    return spool, size
+
 class BalticClient:
     def __init__(self):
         self.tenant_id = os.getenv("AZURE_TENANT_ID")
@@ -82,27 +98,34 @@ class BalticClient:
         return None
 
     def get_pdf_attachment(self, message_id, target_mailbox=None):
-        """Downloads the PDF - either from attachment or from link in HTML body."""
+        """Downloads the PDF - either from attachment or from link in HTML body.
+
+        Returns (file, filename): `file` is a seekable binary stream the caller
+        must close, or (None, None) when no PDF was found.
+        """
         if not target_mailbox:
             target_mailbox = os.getenv("AZURE_TARGET_MAILBOX")
 
         token = self._get_token()
         headers = {'Authorization': 'Bearer ' + token}
         
-        # First try to get direct attachments
+        # First try to get direct attachments. Metadata only — contentBytes
+        # would pull every attachment base64-encoded inside the JSON listing.
         att_url = f"https://graph.microsoft.com/v1.0/users/{target_mailbox}/messages/{message_id}/attachments"
         
-        response = requests.get(att_url, headers=headers)
+        response = requests.get(att_url, headers=headers, params={"$select": "id,name,contentType"})
         response.raise_for_status()
         attachments = response.json().get('value', [])
         
         for att in attachments:
             name = att.get('name', '').lower()
             if name.endswith('.pdf') and att.get('@odata.type') == '#microsoft.graph.fileAttachment':
-                # contentBytes is base64 encoded
-                import base64
                 print(f"DEBUG: Found PDF attachment: {att['name']}")
-                return base64.b64decode(att['contentBytes']), att['name']
+                # $value streams the raw file bytes (no base64 round-trip)
+                with requests.get(f"{att_url}/{att['id']}/$value", headers=headers, stream=True, timeout=60) as raw:
+                    raw.raise_for_status()
+                    pdf_file, _ = _spool_response(raw)
+                return pdf_file, att['name']
         
         # No direct attachment - try to extract PDF link from HTML body
         print("DEBUG: No PDF attachment, checking for PDF link in email body...")
@@ -150,24 +173,24 @@ class BalticClient:
         return None, None
         
     def _download_pdf_from_url(self, url):
-        """Downloads PDF from a URL."""
+        """Downloads PDF from a URL into a spooled temp file."""
         try:
             # Some links might be tracking redirects, follow them
-            response = requests.get(url, allow_redirects=True, timeout=30)
-            response.raise_for_status()
-            
-            # Check if we got a PDF
-            content_type = response.headers.get('Content-Type', '')
-            if 'pdf' in content_type.lower() or url.lower().endswith('.pdf'):
-                filename = url.split('/')[-1].split('?')[0]
-                if not filename.endswith('.pdf'):
-                    filename = 'baltic_report.pdf'
-                print(f"DEBUG: Downloaded PDF: {filename} ({len(response.content)} bytes)")
-                return response.content, filename
-            else:
-                print(f"DEBUG: URL did not return PDF. Content-Type: {content_type}")
-                return None, None
+            with requests.get(url, allow_redirects=True, timeout=30, stream=True) as response:
+                response.raise_for_status()
+
+                # Check if we got a PDF before pulling the body
+                content_type = response.headers.get('Content-Type', '')
+                if 'pdf' in content_type.lower() or url.lower().endswith('.pdf'):
+                    filename = url.split('/')[-1].split('?')[0]
+                    if not filename.endswith('.pdf'):
+                        filename = 'baltic_report.pdf'
+                    pdf_file, size = _spool_response(response)
+                    print(f"DEBUG: Downloaded PDF: {filename} ({size} bytes)")
+                    return pdf_file, filename
+                else:
+                    print(f"DEBUG: URL did not return PDF. Content-Type: {content_type}")
+                    return None, None
         except Exception as e:
             print(f"DEBUG: Failed to download PDF: {e}")
             return None, None
-
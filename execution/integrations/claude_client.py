@@ -4,6 +4,27 @@ import json
 import base64
 from anthropic import Anthropic
 
+# Multiple of 3, so each chunk encodes to whole base64 quads and the pieces
+# concatenate into the same string one b64encode over the full file gives.
+_B64_CHUNK_BYTES = 48 * 1024
+
+
+def _b64encode_pdf(pdf):
+    """Base64 a PDF given as bytes or a binary file object, reading files in
+    chunks so the raw bytes are never held alongside their encoding."""
+    if isinstance(pdf, (bytes, bytearray, memoryview)):
+        return base64.b64encode(pdf).decode("ascii")
+    parts = []
+    carry = b""
+    while chunk := pdf.read(_B64_CHUNK_BYTES):
+        carry += chunk
+        cut = len(carry) - len(carry) % 3
+        parts.append(base64.b64encode(carry[:cut]).decode("ascii"))
+        carry = carry[cut:]
+    parts.append(base64.b64encode(carry).decode("ascii"))
+    return "".join(parts)
+
+
 class ClaudeClient:
     def __init__(self):
         self.api_key = os.getenv("ANTHROPIC_API_KEY")
@@ -11,11 +32,11 @@ class ClaudeClient:
             raise ValueError("ANTHROPIC_API_KEY env var is required")
         self.client = Anthropic(api_key=self.api_key)
 
-    def extract_data_from_pdf(self, pdf_bytes):
-        """Sends PDF bytes to Claude and returns extracted JSON data."""
+    def extract_data_from_pdf(self, pdf):
+        """Sends a PDF (bytes or binary file object) to Claude and returns extracted JSON data."""
         
         # Base64 encode for API
-        pdf_base64 = base64.b64encode(pdf_bytes).decode("utf-8")
+        pdf_base64 = _b64encode_pdf(pdf)
         
         system_prompt = """You are an expert in extracting financial data from Baltic Exchange documents.
 ANALYZE CAREFULLY ALL TABLES in the PDF.
@@ -155,6 +155,11 @@ class ContactList:
 
 # ── Repository ──
 
+# (url, key) -> Supabase client. Handlers build a ContactsRepo per update;
+# sharing the client keeps one HTTP pool instead of a new one per click.
+_clients: dict = {}
+
+
 class ContactsRepo:
     def __init__(self, client=None):
         if client is not None:
@@ -173,7 +178,9 @@ class ContactsRepo:
                     "SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY "
                     "(or SUPABASE_KEY) must be set"
                 )
-            self.client = create_client(url, key)
+            if (url, key) not in _clients:
+                _clients[(url, key)] = create_client(url, key)
+            self.client = _clients[(url, key)]
 
     # ---- Reads ----
 
@@ -8,6 +8,10 @@ from pathlib import Path
 from ..core.logger import WorkflowLogger
 
 class LSEGClient:
+    MAX_CONTRACTS = 6  # Apenas primeiros 6 meses
+    MONTH_CODES = {1:"F", 2:"G", 3:"H", 4:"J", 5:"K", 6:"M", 7:"N", 8:"Q", 9:"U", 10:"V", 11:"X", 12:"Z"}
+    FIELDS = ["TRDPRC_1", "SETTLE", "NETCHNG_1", "PCTCHNG", "EXPIR_DATE"]
+
     def __init__(self):
         self.logger = WorkflowLogger("LSEGClient")
         self.config_path = self._create_config_file()
@@ -68,24 +72,20 @@ class LSEGClient:
         Fetches snapshot of SGX Iron Ore futures 1-12 months.
         Returns list of dicts: { month, price, change, pct_change }
         """
-        MAX_CONTRACTS = 6  # Apenas primeiros 6 meses
-        MONTH_CODES = {1:"F", 2:"G", 3:"H", 4:"J", 5:"K", 6:"M", 7:"N", 8:"Q", 9:"U", 10:"V", 11:"X", 12:"Z"}
-        FIELDS = ["TRDPRC_1", "SETTLE", "NETCHNG_1", "PCTCHNG", "EXPIR_DATE"]
-        
         # Generate RICs
         rics = []
         today = date.today()
-        for i in range(MAX_CONTRACTS):
+        for i in range(self.MAX_CONTRACTS):
             target_date = today + relativedelta(months=i)
             # Logic from original script: Year code is last digit
             year_code = str(target_date.year)[-1]
-            month_code = MONTH_CODES[target_date.month]
+            month_code = self.MONTH_CODES[target_date.month]
             rics.append(f"SZZF{month_code}{year_code}")
             
         self.logger.info(f"Fetching data for: {rics}")
         
         try:
-            df = ld.get_data(universe=rics, fields=FIELDS)
+            df = ld.get_data(universe=rics, fields=self.FIELDS)
             
             if df is None or df.empty:
                 self.logger.warning("No data returned from LSEG")
@@ -95,37 +95,25 @@ class LSEGClient:
             if df.index.name == 'Instrument':
                 df = df.reset_index()
             
-            results = []
-            for _, row in df.iterrows():
-                # Extract Price (prioritize Trade Price, then Settle)
-                price = row.get("TRDPRC_1")
-                if pd.isna(price):
-                    price = row.get("SETTLE")
-                
-                if pd.isna(price):
-                    continue
-                    
-                # Extract columns safely
-                change = row.get("NETCHNG_1", 0.0)
-                if pd.isna(change): change = 0.0
-                
-                pct = row.get("PCTCHNG", 0.0)
-                if pd.isna(pct): pct = 0.0
-                
-                expiry = row.get("EXPIR_DATE")
-                
-                # Format month string Mmm/YY (e.g. Sep/25)
-                month_str = "???"
-                if pd.notna(expiry):
-                    exp_dt = pd.to_datetime(expiry)
-                    month_str = exp_dt.strftime("%b/%y").upper()
-                    
-                results.append({
-                    "month": month_str,
-                    "price": float(price),
-                    "change": float(change),
-                    "pct_change": float(pct)
-                })
+            # Column-wise instead of per-row: trade price, settle as fallback;
+            # contracts with neither are dropped.
+            data = df.reindex(columns=self.FIELDS)
+            price = data["TRDPRC_1"].fillna(data["SETTLE"])
+            has_price = price.notna()
+            data, price = data[has_price], price[has_price]
+
+            change = data["NETCHNG_1"].fillna(0.0)
+            pct = data["PCTCHNG"].fillna(0.0)
+            # Format month string Mmm/YY (e.g. Sep/25)
+            expiry = pd.to_datetime(data["EXPIR_DATE"], errors="coerce")
+            month = expiry.dt.strftime("%b/%y").str.upper().fillna("???")
+
+            results = pd.DataFrame({
+                "month": month,
+                "price": price,
+                "change": change,
+                "pct_change": pct,
+            }).astype({"price": float, "change": float, "pct_change": float}).to_dict("records")
                 
             # Sort by expiration (naive sort by list order is usually fine if returned in order, 
             # but LSEG might shuffle. Since we generated RICs in order, we can map back if needed.
@@ -2,7 +2,7 @@
 import os
 import sys
 import pandas as pd
-from datetime import datetime
+from datetime import date, datetime, time
 from ..core.logger import WorkflowLogger
 
 try:
@@ -94,11 +94,15 @@ class PlattsClient:
             self.logger.error(f"Error fetching {symbol}", {"error": str(e)})
             return pd.DataFrame()
 
-    def get_report_data(self, target_date: datetime) -> list:
+    def get_report_data(self, target_date: date) -> list:
         """
         Coleta dados do dia alvo e do dia útil anterior para calcular variações via Polling.
+        Aceita `date` ou `datetime` (date é promovido pra meia-noite).
         Retorna lista pronta para o relatório.
         """
+        if not isinstance(target_date, datetime):
+            target_date = datetime.combine(target_date, time.min)
+
         # Calcular dia útil anterior para comparação
         weekday = target_date.weekday()
         if weekday == 0: # Monday -> Friday
@@ -2,8 +2,43 @@
 import os
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ..core.logger import WorkflowLogger
 
+# Shared keep-alive session: TelegramClient is built per call site, so a
+# module-level pool keeps the TLS connection to api.telegram.org warm
+# across instances. Retries cover only failures where Telegram certainly
+# did not take the message: connect errors, and 429 (waiting out its
+# Retry-After). Read errors and 5xx are never retried, so a sendMessage
+# is never duplicated.
+class _CappedRetry(Retry):
+    """Retry whose Retry-After wait is clamped to 600s, the same ceiling
+    DeliveryReporter applies, so a hostile header cannot stall a caller."""
+
+    MAX_RETRY_AFTER = 600.0
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.MAX_RETRY_AFTER)
+
+
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=_CappedRetry(
+        total=3, connect=3, read=0, status=2,
+        backoff_factor=0.3,
+        status_forcelist=[429],
+        allowed_methods=None,  # POST included — safe for the 429-only forcelist
+        respect_retry_after_header=True,
+        raise_on_status=False,  # last 429 surfaces via raise_for_status()
+    ),
+))
+
 class TelegramClient:
     """
     Client for sending messages via Telegram Bot API.
@@ -45,7 +80,7 @@ class TelegramClient:
             payload["reply_markup"] = json.dumps(reply_markup)
         
         try:
-            response = requests.post(
+            response = _SESSION.post(
                 f"{self.base_url}/sendMessage",
                 data=payload,
                 timeout=10
@@ -109,7 +144,7 @@ class TelegramClient:
         Answer a callback query (button press acknowledgement).
         """
         try:
-            response = requests.post(
+            response = _SESSION.post(
                 f"{self.base_url}/answerCallbackQuery",
                 data={
                     "callback_query_id": callback_query_id,
@@ -127,7 +162,7 @@ class TelegramClient:
         Edit an existing message (e.g., to remove buttons after approval).
         """
         try:
-            response = requests.post(
+            response = _SESSION.post(
                 f"{self.base_url}/editMessageText",
                 data={
                     "chat_id": chat_id,
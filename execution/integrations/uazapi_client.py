@@ -1,9 +1,21 @@
 import os
 import requests
 import time
+from requests.adapters import HTTPAdapter
 from ..core.logger import WorkflowLogger
 from ..core.retry import retry_with_backoff
 
+
+def _is_transient(exc: Exception) -> bool:
+    """Worth retrying: network errors and 5xx. 4xx (invalid number, bad
+    token) fail the same way every time, and a 429 goes straight up to
+    DeliveryReporter, which owns the Retry-After / AIMD back-off."""
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    if not isinstance(status, int):
+        return True
+    return status >= 500
+
+
 class UazapiClient:
     def __init__(self):
         # Fallback robusto: se env var vazia ou não definida, usa default
@@ -12,20 +24,22 @@ class UazapiClient:
         
         if not self.token:
             raise ValueError("UAZAPI_TOKEN must be set")
-            
+
+        # Same headers on every call — build once per client, not per send.
+        self._headers = {"token": self.token, "Content-Type": "application/json"}
+        # Keep-alive session: a broadcast reuses one TCP+TLS connection
+        # instead of handshaking per contact.
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
         self.logger = WorkflowLogger("UazapiClient")
 
-    @retry_with_backoff(max_attempts=3, base_delay=2.0)
+    @retry_with_backoff(max_attempts=3, base_delay=2.0, jitter=1.0, retry_if=_is_transient)
     def send_message(self, number, text):
         """
         Send text message via Uazapi.
         Includes rate limit handling (handled by caller mostly, but retry handles 500s)
         """
         url = f"{self.base_url}/send/text"
-        headers = {
-            "token": self.token,
-            "Content-Type": "application/json"
-        }
         # Enviar como JSON (confirmado na documentação oficial)
         payload = {
             "number": str(number),
@@ -33,7 +47,7 @@ class UazapiClient:
         }
         
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=10)
+            response = self.session.post(url, headers=self._headers, json=payload, timeout=10)
             
             # Debug: print response for 4xx errors
             if response.status_code >= 400:
@@ -46,7 +60,7 @@ class UazapiClient:
             self.logger.error(f"Failed to send to {number}", {"error": str(e)})
             raise e
 
-    @retry_with_backoff(max_attempts=3, base_delay=2.0)
+    @retry_with_backoff(max_attempts=3, base_delay=2.0, jitter=1.0, retry_if=_is_transient)
     def send_document(
         self,
         number: str,
@@ -60,7 +74,6 @@ class UazapiClient:
         Graph `@microsoft.graph.downloadUrl` works because it's a pre-auth'd URL.
         """
         url = f"{self.base_url}/send/media"
-        headers = {"token": self.token, "Content-Type": "application/json"}
         payload = {
             "number": str(number),
             "type": "document",
@@ -69,7 +82,7 @@ class UazapiClient:
             "text": str(caption or ""),
         }
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = self.session.post(url, headers=self._headers, json=payload, timeout=30)
             if response.status_code >= 400:
                 self.logger.error(
                     f"send_document failed: {response.status_code} {response.text[:300]}"
@@ -18,9 +18,11 @@ import requests
 import json
 import uuid
 from datetime import datetime
+from pathlib import Path
 
 # Adjust path to allow imports from root
-sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(_ROOT))
 
 from execution.integrations.contacts_repo import ContactsRepo
 from execution.core.delivery_reporter import DeliveryReporter, build_delivery_contact
@@ -49,13 +51,17 @@ def get_emoji(direction):
     if direction == 'DOWN': return '📉'
     return '➡️'
 
+# Format specs for the decimals the report uses; '+' signs positives, so no
+# separate sign branch. Other precisions build their spec on the fly.
+_CHANGE_SPECS = {0: "+.0f", 2: "+.2f"}
+
 def format_change(change, decimals=0):
     if not change: return "0"
     try:
         val = float(change)
-        sign = "+" if val > 0 else ""
-        fmt = f"{{:.{decimals}f}}"
-        return f"{sign}{fmt.format(val)}"
+        if val == 0:  # "0" / "0.00" strings: no sign, as before
+            return format(val, f".{decimals}f")
+        return format(val, _CHANGE_SPECS.get(decimals) or f"+.{decimals}f")
     except:
         return str(change)
 
@@ -387,21 +393,23 @@ async def _run_with_progress(args, chat_id: int, today_str: str) -> None:
             inflight_held = True
 
         # ── PHASE 4: extract PDF attachment ───────────────────────────────────
-        pdf_bytes, filename = await asyncio.to_thread(baltic.get_pdf_attachment, msg['id'])
+        pdf_file, filename = await asyncio.to_thread(baltic.get_pdf_attachment, msg['id'])
 
-        if not pdf_bytes:
+        if not pdf_file:
             logger.warning("No PDF attachment found in the email.")
             await reporter.step("No PDF found", "email had no PDF attachment", level="info")
             await reporter.finish()
             return
 
-        logger.info(f"Downloaded PDF: {filename}")
-        await reporter.step("PDF extracted", filename or "attachment downloaded")
+        # The spooled PDF may already be on disk; close it on every path.
+        with pdf_file:
+            logger.info(f"Downloaded PDF: {filename}")
+            await reporter.step("PDF extracted", filename or "attachment downloaded")
 
-        # ── PHASE 5: Claude extraction ────────────────────────────────────────
-        logger.info("Sending to Claude for extraction...")
-        claude = ClaudeClient()
-        data = await asyncio.to_thread(claude.extract_data_from_pdf, pdf_bytes)
+            # ── PHASE 5: Claude extraction ────────────────────────────────────
+            logger.info("Sending to Claude for extraction...")
+            claude = ClaudeClient()
+            data = await asyncio.to_thread(claude.extract_data_from_pdf, pdf_file)
 
         if not data or data.get('extraction_confidence') == 'low':
             logger.error("Extraction failed or low confidence.")
@@ -3,10 +3,13 @@ import requests
 import os
 import json
 import sys
+from pathlib import Path
+
 from dotenv import load_dotenv
 
 # Load env vars
-load_dotenv(os.path.join(os.path.dirname(__file__), "../../.env"))
+_ROOT = Path(__file__).resolve().parents[2]
+load_dotenv(_ROOT / ".env")
 
 TOKEN = os.getenv("APIFY_API_TOKEN")
 DATASET_ID = "U8cZtEYLn5VirmWxQ" # Dataset from run jh06eWY6E6LcKlVd9
@@ -17,11 +20,29 @@ if not TOKEN:
 
 url = f"https://api.apify.com/v2/datasets/{DATASET_ID}/items?token={TOKEN}"
 
+# Datasets are immutable once the run finishes, so re-running this against
+# the same DATASET_ID should be a 304, not a full re-download.
+CACHE_DIR = Path.home() / ".cache" / "apify"
+etag_file = CACHE_DIR / f"{DATASET_ID}.etag"
+body_file = CACHE_DIR / f"{DATASET_ID}.json"
+
 try:
     print(f"Fetching dataset {DATASET_ID}...")
-    r = requests.get(url)
-    r.raise_for_status()
-    data = r.json()
+    headers = {"Accept-Encoding": "gzip"}
+    if etag_file.exists() and body_file.exists():
+        headers["If-None-Match"] = etag_file.read_text().strip()
+    r = requests.get(url, headers=headers, timeout=60)
+    if r.status_code == 304:
+        print("Not modified, using cached copy.")
+        data = json.loads(body_file.read_bytes())
+    else:
+        r.raise_for_status()
+        data = r.json()
+        etag = r.headers.get("ETag")
+        if etag:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            body_file.write_bytes(r.content)
+            etag_file.write_text(etag)
     
     if not data:
         print("Dataset is empty []")
@@ -2,33 +2,20 @@ import json
 import os
 import sys
 from datetime import datetime
+from pathlib import Path
+
 from dotenv import load_dotenv
 
 # Add parent dir to sys.path to allow imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../'))
+_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(_ROOT))
 
 from execution.agents.rationale_agent import RationaleAgent
 from execution.core.logger import WorkflowLogger
+from execution.curation.drafts_file import append_draft
 
 # Load env vars
-load_dotenv(os.path.join(os.path.dirname(__file__), "../../.env"))
-
-def save_draft(draft_data):
-    drafts_file = os.path.join(os.path.dirname(__file__), '../../data/news_drafts.json')
-    
-    if os.path.exists(drafts_file):
-        with open(drafts_file, 'r') as f:
-            try:
-                drafts = json.load(f)
-            except:
-                drafts = []
-    else:
-        drafts = []
-        
-    drafts.append(draft_data)
-    
-    with open(drafts_file, 'w') as f:
-        json.dump(drafts, f, indent=2, ensure_ascii=False)
+load_dotenv(_ROOT / ".env")
 
 def main():
     logger = WorkflowLogger("ManualJsonIngestion")
@@ -77,7 +64,7 @@ def main():
             "source_summary": (items[0].get('title') or "Sem Título") + "..." 
         }
         
-        save_draft(draft_obj)
+        append_draft(draft_obj)
         logger.info("Draft saved successfully from LOCAL JSON.")
 
     except Exception as e:
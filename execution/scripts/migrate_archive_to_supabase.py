@@ -30,13 +30,22 @@ def _archive_row(key: str, data: dict) -> dict:
     return row
 
 
-def backfill() -> int:
-    """Read all platts:archive:* keys and upsert them. Returns count processed."""
-    client = redis_client._get_client()
-    sb = get_news_client()
-    count = 0
-    for key in client.scan_iter(match="platts:archive:*", count=500):
-        raw = client.get(key)
+_BATCH = 500
+
+
+def _upsert_batch(sb, rows: list) -> None:
+    """One upsert per row shape — PostgREST bulk payloads need uniform keys,
+    and optional columns (archived_at, scraped_at…) vary per item."""
+    by_shape: dict = {}
+    for row in rows:
+        by_shape.setdefault(frozenset(row), []).append(row)
+    for batch in by_shape.values():
+        sb.table(TABLE).upsert(batch, on_conflict="id", ignore_duplicates=True).execute()
+
+
+def _rows(keys: list, raws: list) -> list:
+    rows = []
+    for key, raw in zip(keys, raws):
         if not raw:
             continue
         try:
@@ -45,9 +54,31 @@ def backfill() -> int:
             continue
         if not isinstance(data, dict):
             continue
-        row = _archive_row(key, data)
-        sb.table(TABLE).upsert(row, on_conflict="id", ignore_duplicates=True).execute()
-        count += 1
+        rows.append(_archive_row(key, data))
+    return rows
+
+
+def backfill() -> int:
+    """Read all platts:archive:* keys and upsert them in batches of _BATCH
+    (one MGET + one upsert per shape). Returns count processed."""
+    client = redis_client._get_client()
+    sb = get_news_client()
+    count = 0
+    keys: list = []
+
+    def _flush() -> int:
+        rows = _rows(keys, client.mget(keys))
+        if rows:
+            _upsert_batch(sb, rows)
+        keys.clear()
+        return len(rows)
+
+    for key in client.scan_iter(match="platts:archive:*", count=_BATCH):
+        keys.append(key)
+        if len(keys) >= _BATCH:
+            count += _flush()
+    if keys:
+        count += _flush()
     return count
 
 
@@ -10,10 +10,13 @@ import os
 import sys
 import argparse
 import time as _time
-from datetime import datetime, date
+from datetime import datetime, date, timedelta, timezone
+from pathlib import Path
+from types import MappingProxyType
 
 # Adjust path to allow imports from root
-sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(_ROOT))
 
 from execution.core.event_bus import with_event_bus, get_current_bus
 from execution.core.logger import WorkflowLogger
@@ -23,14 +26,11 @@ from execution.core import state_store
 from execution.integrations.platts_client import PlattsClient
 from execution.integrations.contacts_repo import ContactsRepo
 from execution.integrations.uazapi_client import UazapiClient
-
-# --- CONFIGURATION (Whitelists ported from JS) ---
+from execution.core.report_format import build_header, format_row, marker_for
 
 # --- CONFIGURATION (Whitelists using Variable Keys for stability) ---
 
-# --- CONFIGURATION (Whitelists using Symbols) ---
-
-FINES_KEYS = [
+FINES_KEYS = frozenset({
     "IOBBA00", # Brazilian Blend Fines CFR Qingdao
     "IODFE00", # IO fines Fe 58%
     "IOPRM00", # IO fines Fe 65%
@@ -40,16 +40,16 @@ FINES_KEYS = [
     "IOPBQ00", # Pilbara Blend Fines CFR Qingdao
     "IODBZ00", # IODEX CFR CHINA 62% Fe
     "TS01021", # TSI Iron Ore Fines 62% Fe CFR China
-]
+})
 
-LUMP_PELLET_KEYS = [
+LUMP_PELLET_KEYS = frozenset({
     "IODRP00", # Iron Ore 67.5% Fe DR Pellet Premium
     "IOCQR04", # Iron Ore Blast Furnace 63% Fe Pellet CFR China
     "IOBFC04", # Iron Ore Blast Furnace Pellet Premium CFR China Wkly
     "IOCLS00", # Iron Ore Lump Outright Price CFR China
-]
+})
 
-VIU_KEYS = [
+VIU_KEYS = frozenset({
     "IOALE00", # Alumina Diff 2.5-4%
     "TSIAF00", # Alumina Diff <5% (55-60% Fe)
     "TSIAD00", # Fe Diff
@@ -63,11 +63,25 @@ VIU_KEYS = [
     "IOPPS10", # Silica Diff 4.5-6.5%
     "IOPPS20", # Silica Diff 6.5-9%
     "IOMGD00", # Mid Range Diff 60-63.5 Fe
-]
-
-FREIGHT_KEYS = [] # No freight symbols mapped yet
-
-FREIGHT_KEYS = [] # No freight mapped
+})
+
+FREIGHT_KEYS = frozenset() # No freight symbols mapped yet
+
+# Section order in the message; each variable_key maps to one bucket index.
+SECTION_TITLES = (
+    "🪨 *FINES*",
+    "🧱 *LUMP AND PELLET*",
+    "🧪 *VIU DIFFERENTIALS*",
+    "🚢 *FREIGHT*",
+)
+# Blank line + title + newline, built once per process instead of per report
+_SECTION_PREFIXES = tuple(f"\n\n{title}\n" for title in SECTION_TITLES)
+KEY_TO_SECTION = MappingProxyType({
+    **{k: 0 for k in FINES_KEYS},
+    **{k: 1 for k in LUMP_PELLET_KEYS},
+    **{k: 2 for k in VIU_KEYS},
+    **{k: 3 for k in FREIGHT_KEYS},
+})
 
 REPORT_TYPE = "MORNING_REPORT"
 
@@ -80,29 +94,14 @@ _MIN_ITEMS_EXPECTED = 10
 _TOTAL_SYMBOLS_CONFIGURED = 26
 
 
-def normalize_text(text):
-    if not text: return ""
-    return " ".join(str(text).strip().lower().split())
-
-def desc_keys(item):
-    """Generates normalized keys for matching (description and description+unit)."""
-    desc = normalize_text(item.get('product', ''))
-    unit = normalize_text(item.get('unit', ''))
-    keys = [desc]
-    if unit and unit not in desc:
-        keys.append(normalize_text(f"{desc} {unit}"))
-    return keys
-
 def format_line(item):
     """Formats a single item line via the shared row renderer."""
     if not item: return None
 
-    from execution.core.report_format import format_row, marker_for
-
     desc = item.get('product', 'Unknown')
     price = item['price']
-    change = item.get('change', 0)
-    pct = item.get('changePercent', 0)
+    change = item.get('change', 0) or 0
+    pct = item.get('changePercent', 0) or 0
 
     if change > 0:
         stats = f"+{change:.2f} (+{pct:.2f}%)"
@@ -113,66 +112,40 @@ def format_line(item):
 
     return format_row(desc, f"${price:.2f}", stats, marker_for(change))
 
-def filter_by_keys(items, keys_whitelist):
-    """Filters items matching whitelist KEYS (more stable than description)."""
-    results = []
-    # Convert list to set for O(1)
-    wanted = set(keys_whitelist)
-    
-    for item in items:
-        # Check if variable_key matches
-        if item.get('variable_key') in wanted:
-            line = format_line(item)
-            if line: results.append(line)
-            
-    return results
-
-def get_section(title, lines):
-    if not lines: return None
-    joined = "\n".join(lines)
-    return f"{title}\n{joined}"
-
 def _pill_date_from(date_str):
     """'09/07/2026' -> date. Cai pra hoje (BRT) quando não parseia."""
-    from datetime import datetime as _dt, timezone, timedelta
     try:
-        return _dt.strptime(date_str, "%d/%m/%Y").date()
+        return datetime.strptime(date_str, "%d/%m/%Y").date()
     except (ValueError, TypeError):
-        return _dt.now(timezone(timedelta(hours=-3))).date()
+        return datetime.now(timezone(timedelta(hours=-3))).date()
 
 def build_message(report_items, date_str):
     """
     Orchestrates the message construction with sections.
     """
-    # Filter by KEYS logic
-    fines_lines = filter_by_keys(report_items, FINES_KEYS)
-    lump_lines = filter_by_keys(report_items, LUMP_PELLET_KEYS)
-    viu_lines = filter_by_keys(report_items, VIU_KEYS)
-    freight_lines = filter_by_keys(report_items, FREIGHT_KEYS)
+    # Bucket by KEYS in a single pass
+    buckets = [[] for _ in SECTION_TITLES]
+    for item in report_items:
+        idx = KEY_TO_SECTION.get(item.get('variable_key'))
+        if idx is None:
+            continue
+        line = format_line(item)
+        if line: buckets[idx].append(line)
 
     # Fallback/Hints deprecated for now as we only have 8 specific keys mapped
     # If customer adds more keys to PlattsClient.SYMBOLS_MAPPING later, add them to lists above.
 
     # Build parts
-    from execution.core.report_format import build_header
     header = build_header(
         "Assessments Platts — Abertura", "IRON ORE", _pill_date_from(date_str)
     )
-    parts = [header]
-    
-    s1 = get_section("🪨 *FINES*", fines_lines)
-    if s1: parts.extend(["", s1])
-    
-    s2 = get_section("🧱 *LUMP AND PELLET*", lump_lines)
-    if s2: parts.extend(["", s2])
-    
-    s3 = get_section("🧪 *VIU DIFFERENTIALS*", viu_lines)
-    if s3: parts.extend(["", s3])
-    
-    s4 = get_section("🚢 *FREIGHT*", freight_lines)
-    if s4: parts.extend(["", s4])
-    
-    return "\n".join(parts)
+    # Flat chunk list, joined once: header, then "\n\n<title>\n<lines>" per non-empty section
+    chunks = [header]
+    for prefix, lines in zip(_SECTION_PREFIXES, buckets):
+        if lines:
+            chunks += (prefix, "\n".join(lines))
+
+    return "".join(chunks)
 
 
 def deliver_message(message, dry_run, progress, bus, logger) -> bool:
@@ -307,7 +280,7 @@ def _run_pipeline(args):
         bus.emit("step", label="Baixando dados Platts")
         platts = PlattsClient()
         t0 = _time.time()
-        report_items = platts.get_report_data(datetime.combine(today, datetime.min.time()))
+        report_items = platts.get_report_data(today)
         bus.emit("api_call", label="platts.get_report_data",
                  detail={"duration_ms": int((_time.time() - t0) * 1000),
                          "rows": len(report_items) if report_items else 0})
@@ -11,6 +11,7 @@ import sys
 import traceback
 import uuid
 from datetime import datetime
+from typing import Iterable
 
 from dotenv import load_dotenv
 
@@ -30,7 +31,7 @@ ACTOR_ID = os.getenv("APIFY_PLATTS_ACTOR_ID", "bigodeio05/platts-scrap-full-news
 WORKFLOW_NAME = "platts_ingestion"
 
 
-def _flatten_dataset(items: list) -> list:
+def _flatten_dataset(items: Iterable) -> list:
     """Flatten merged-actor dataset shape into a flat list of article dicts.
 
     The actor returns a single wrapper with keys flash/topNews/latest/newsInsights/
@@ -128,18 +129,18 @@ async def _run_with_progress(args, logger, chat_id: int, today_br: str, date_iso
                 }],
                 "summary": {"totalArticles": 2},
             }]
+            articles = _flatten_dataset(items)
         else:
             bus.emit("step", label="Disparando Apify actor")
             logger.info(f"Running Apify Actor: {ACTOR_ID}")
             client = ApifyClient()
             t0 = _time.time()
-            dataset_id, items = await asyncio.to_thread(
+            dataset_id, rows, articles = await asyncio.to_thread(
                 _run_apify_sync, client, run_input,
             )
-            bus.emit("api_call", label="apify.run", detail={"duration_ms": round((_time.time() - t0) * 1000), "rows": len(items) if items else 0})
+            bus.emit("api_call", label="apify.run", detail={"duration_ms": round((_time.time() - t0) * 1000), "rows": rows})
 
-        # ── PHASE 2: flatten dataset ───────────────────────────────────────────
-        articles = _flatten_dataset(items)
+        # ── PHASE 2: flatten dataset (done above; Apify path streams it) ───────
         logger.info(f"Flattened to {len(articles)} articles.")
         await reporter.step("Dataset fetched", f"{len(articles)} articles after flatten")
 
@@ -203,10 +204,20 @@ async def _run_with_progress(args, logger, chat_id: int, today_br: str, date_iso
 
 
 def _run_apify_sync(client: ApifyClient, run_input: dict):
-    """Blocking helper: run actor and fetch items. Runs inside asyncio.to_thread."""
+    """Blocking helper: run actor, then stream the dataset straight into
+    _flatten_dataset so the raw pages are never held as one list.
+    Runs inside asyncio.to_thread. Returns (dataset_id, rows, articles)."""
     dataset_id = client.run_actor(ACTOR_ID, run_input, memory_mbytes=8192)
-    items = client.get_dataset_items(dataset_id)
-    return dataset_id, items
+    rows = 0
+
+    def _counted():
+        nonlocal rows
+        for item in client.iter_dataset_items(dataset_id):
+            rows += 1
+            yield item
+
+    articles = _flatten_dataset(_counted())
+    return dataset_id, rows, articles
 
 
 @with_event_bus("platts_ingestion")
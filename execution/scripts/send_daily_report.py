@@ -9,16 +9,26 @@ import os
 import sys
 import argparse
 import time as _time
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 # Adjust path to allow imports from root
-sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(_ROOT))
 
 from execution.core.event_bus import with_event_bus, get_current_bus
 from execution.core.logger import WorkflowLogger
 from execution.core.delivery_reporter import DeliveryReporter, build_delivery_contact
 from execution.integrations.contacts_repo import ContactsRepo
 from execution.core.progress_reporter import ProgressReporter
+from execution.core.report_format import (
+    build_header,
+    format_row,
+    marker_for,
+    translate_contract_month,
+)
+
+BRT = timezone(timedelta(hours=-3))
 
 
 def format_price_message(prices):
@@ -26,16 +36,6 @@ def format_price_message(prices):
     Formats the price list with backtick-highlighted prices.
     Expects 'prices' to be a list of dicts: {month, price, change, pct_change}
     """
-    from datetime import timezone, timedelta
-
-    from execution.core.report_format import (
-        build_header,
-        format_row,
-        marker_for,
-        translate_contract_month,
-    )
-
-    BRT = timezone(timedelta(hours=-3))
     today = datetime.now(BRT).date()
 
     lines = [build_header("Curva SGX — Iron Ore 62% Fe", "IRON ORE FUTURES", today), ""]
@@ -4,9 +4,11 @@ import asyncio
 import sys
 import os
 import argparse
+from pathlib import Path
 
 # Add project root to path
-sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
+_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(_ROOT))
 
 from execution.integrations.contacts_repo import ContactsRepo
 from execution.integrations.uazapi_client import UazapiClient
@@ -0,0 +1,50 @@
+"""Tests for ApifyClient dataset streaming."""
+from unittest.mock import MagicMock
+
+from execution.integrations.apify_client import ApifyClient
+
+
+def _client(items):
+    client = ApifyClient(token="t")
+    sdk = MagicMock()
+    sdk.dataset.return_value.iterate_items.side_effect = lambda: iter(items)
+    client.client = sdk
+    return client
+
+
+def test_iter_dataset_items_is_lazy():
+    consumed = []
+
+    def gen():
+        for i in range(3):
+            consumed.append(i)
+            yield {"n": i}
+
+    client = _client([])
+    client.client.dataset.return_value.iterate_items.side_effect = gen
+    it = client.iter_dataset_items("ds")
+    assert next(it) == {"n": 0}
+    assert consumed == [0]
+
+
+def test_get_dataset_items_returns_full_list():
+    client = _client([{"n": 1}, {"n": 2}])
+    assert client.get_dataset_items("ds") == [{"n": 1}, {"n": 2}]
+    client.client.dataset.assert_called_with("ds")
+
+
+def test_platts_ingestion_streams_dataset_into_flatten():
+    from unittest.mock import MagicMock
+    from execution.scripts.platts_ingestion import _run_apify_sync
+
+    client = MagicMock()
+    client.run_actor.return_value = "ds1"
+    client.iter_dataset_items.return_value = iter([
+        {"topNews": [{"title": "a"}], "latest": [{"title": "b"}, "junk"]},
+    ])
+
+    dataset_id, rows, articles = _run_apify_sync(client, {})
+
+    assert (dataset_id, rows) == ("ds1", 1)
+    assert [a["title"] for a in articles] == ["a", "b"]
+    client.get_dataset_items.assert_not_called()
@@ -73,3 +73,17 @@ def test_baltic_data_invalida_cai_pra_hoje():
     msg = format_whatsapp_message(dados)
     hoje = datetime.now(timezone(timedelta(hours=-3))).date()
     assert f"`FRETE · {pill_date(hoje)}`" in msg
+
+
+def test_format_change_sinal_e_casas():
+    from execution.scripts.baltic_ingestion import format_change
+
+    assert format_change(25, 0) == "+25"
+    assert format_change(-0.186, 2) == "-0.19"
+    assert format_change(0.4, 0) == "+0"
+    assert format_change(1.2345, 3) == "+1.234"
+    assert format_change(0, 2) == "0"
+    assert format_change(None, 2) == "0"
+    assert format_change("0", 0) == "0"
+    assert format_change("0.00", 2) == "0.00"
+    assert format_change("n/a", 2) == "n/a"
@@ -10,6 +10,7 @@ Reference: docs/superpowers/specs/2026-04-22-idempotency-claim-ordering-fix-desi
 from __future__ import annotations
 
 import argparse
+import io
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock
 
@@ -84,7 +85,7 @@ def patched_integrations(monkeypatch):
 
     baltic_instance = MagicMock()
     baltic_instance.find_latest_email.return_value = _msg(_today_iso())
-    baltic_instance.get_pdf_attachment.return_value = (b"fake-pdf-bytes", "baltic.pdf")
+    baltic_instance.get_pdf_attachment.return_value = (io.BytesIO(b"fake-pdf-bytes"), "baltic.pdf")
 
     claude_instance = MagicMock()
     claude_instance.extract_data_from_pdf.return_value = VALID_CLAUDE_DATA
@@ -315,6 +316,29 @@ async def test_scenario_6_claude_low_confidence(
     assert len(spy_state_store["release_inflight"]) == 1
 
 
+@pytest.mark.asyncio
+async def test_scenario_6b_claude_client_init_fails_closes_pdf(
+    spy_state_store, patched_integrations, patched_bot_and_progress, baltic_env,
+    active_bus, monkeypatch,
+):
+    """ClaudeClient() raising before extraction must still close the spooled PDF."""
+    from execution.scripts import baltic_ingestion as mod
+
+    pdf = io.BytesIO(b"fake-pdf-bytes")
+    patched_integrations["baltic"].get_pdf_attachment.return_value = (pdf, "baltic.pdf")
+
+    def _boom():
+        raise RuntimeError("no api key")
+
+    monkeypatch.setattr(mod, "ClaudeClient", _boom)
+
+    with pytest.raises(RuntimeError, match="no api key"):
+        await _invoke(dry_run=False)
+
+    assert pdf.closed
+    assert len(spy_state_store["release_inflight"]) == 1
+
+
 @pytest.mark.asyncio
 async def test_scenario_7_full_success(
     patched_integrations, patched_bot_and_progress, baltic_env, active_bus, monkeypatch,
@@ -80,3 +80,20 @@ async def test_user_role_injected_into_data():
     with patch("bot.middlewares.auth.get_user_role", return_value="admin"):
         await mw(handler, event, data)
     assert data["user_role"] == "admin"
+
+
+@pytest.mark.asyncio
+async def test_update_dedup_drops_redelivered_update(monkeypatch):
+    import fakeredis
+    from bot.routers import _helpers
+    from bot.middlewares.dedup import UpdateDedupMiddleware
+
+    fake = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(_helpers, "_drafts_client", lambda: fake)
+    mw = UpdateDedupMiddleware()
+    handler = AsyncMock(return_value="result")
+
+    assert await mw(handler, MagicMock(update_id=101), {}) == "result"
+    assert await mw(handler, MagicMock(update_id=101), {}) is None
+    assert await mw(handler, MagicMock(update_id=102), {}) == "result"
+    assert handler.await_count == 2
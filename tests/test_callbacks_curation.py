@@ -144,6 +144,28 @@ async def test_draft_action_approve_already_processed_short_circuits(
     create_task.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_draft_action_approve_lost_claim_short_circuits(
+    mock_callback_query, mocker,
+):
+    """Double tap: the second callback still sees 'pending' but loses the claim."""
+    query = mock_callback_query(data="draft:approve:race1")
+    mocker.patch(
+        "bot.routers.callbacks_curation.drafts_get",
+        return_value={"message": "hi", "status": "pending"},
+    )
+    mocker.patch("bot.routers.callbacks_curation.claim_once", return_value=False)
+    drafts_update = mocker.patch("bot.routers.callbacks_curation.drafts_update")
+    mocker.patch("bot.routers.callbacks_curation.get_bot", return_value=AsyncMock())
+    create_task = mocker.patch("asyncio.create_task")
+
+    await on_draft_action(query, DraftAction(action="approve", draft_id="race1"))
+
+    query.answer.assert_awaited_with("⏳ Já em andamento")
+    drafts_update.assert_not_called()
+    create_task.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_draft_action_approve_missing_draft_answers_expired(
     mock_callback_query, mocker,
@@ -295,6 +317,29 @@ async def test_broadcast_confirm_send_happy_path_dispatches(
     create_task.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_broadcast_confirm_send_lost_claim_does_not_resend(
+    mock_callback_query, mocker,
+):
+    """Double tap / redelivered callback: the broadcast must go out once."""
+    query = mock_callback_query(data="bcast:send:bcast_1")
+    mocker.patch(
+        "bot.routers.callbacks_curation.drafts_get",
+        return_value={"message": "direct text", "status": "approved"},
+    )
+    claim = mocker.patch("bot.routers.callbacks_curation.claim_once", return_value=False)
+    drafts_update = mocker.patch("bot.routers.callbacks_curation.drafts_update")
+    mocker.patch("bot.routers.callbacks_curation.get_bot", return_value=AsyncMock())
+    create_task = mocker.patch("asyncio.create_task")
+
+    await on_broadcast_confirm(query, BroadcastConfirm(action="send", draft_id="bcast_1"))
+
+    claim.assert_called_once_with("approve:bcast_1")
+    query.answer.assert_awaited_with("⏳ Já em andamento")
+    drafts_update.assert_not_called()
+    create_task.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_broadcast_confirm_cancel_finalizes_without_dispatch(
     mock_callback_query, mocker,
@@ -407,3 +452,23 @@ async def test_curate_action_send_raw_falls_back_to_supabase(
     assert to_thread.await_count == 4
     query.answer.assert_awaited_with("📲 Enviando para WhatsApp...")
     create_task.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_curate_action_send_raw_lost_claim_skips_archive_and_send(
+    mock_callback_query, fsm_context_in_state, mocker,
+):
+    query = mock_callback_query(data="curate:send_raw:item2")
+    state = fsm_context_in_state()
+    item = {"title": "Hdr", "fullText": "Body text"}
+    to_thread = mocker.patch("asyncio.to_thread", new=AsyncMock(side_effect=[item]))
+    claim = mocker.patch("bot.routers.callbacks_curation.claim_once", return_value=False)
+    mocker.patch("bot.routers.callbacks_curation.get_bot", return_value=AsyncMock())
+    create_task = mocker.patch("asyncio.create_task")
+
+    await on_curate_action(query, CurateAction(action="send_raw", item_id="item2"), state)
+
+    claim.assert_called_once_with("send_raw:item2")
+    assert to_thread.await_count == 1  # get_staging only — no set_status/discard
+    query.answer.assert_awaited_with("⏳ Já em andamento")
+    create_task.assert_not_called()
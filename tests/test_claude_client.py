@@ -0,0 +1,38 @@
+"""Tests for execution.integrations.claude_client PDF encoding."""
+import base64
+import io
+
+
+def _pdf_payload(size: int) -> bytes:
+    return bytes(i % 251 for i in range(size))
+
+
+def test_b64encode_pdf_bytes_matches_stdlib():
+    from execution.integrations.claude_client import _b64encode_pdf
+    data = _pdf_payload(1000)
+    assert _b64encode_pdf(data) == base64.b64encode(data).decode("ascii")
+
+
+def test_b64encode_pdf_stream_matches_one_shot_encoding():
+    from execution.integrations.claude_client import _b64encode_pdf, _B64_CHUNK_BYTES
+    for size in (0, 1, 2, 3, _B64_CHUNK_BYTES - 1, _B64_CHUNK_BYTES, 3 * _B64_CHUNK_BYTES + 7):
+        data = _pdf_payload(size)
+        assert _b64encode_pdf(io.BytesIO(data)) == base64.b64encode(data).decode("ascii")
+
+
+class _ShortReads(io.RawIOBase):
+    """Returns at most 1000 bytes per read — misaligned with base64 quads."""
+    def __init__(self, data):
+        self._buf = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def read(self, n=-1):
+        return self._buf.read(min(n, 1000) if n and n > 0 else 1000)
+
+
+def test_b64encode_pdf_handles_short_reads():
+    from execution.integrations.claude_client import _b64encode_pdf
+    data = _pdf_payload(10_001)
+    assert _b64encode_pdf(_ShortReads(data)) == base64.b64encode(data).decode("ascii")
@@ -567,3 +567,17 @@ def test_get_by_phone_still_rejects_pure_garbage(fake_client):
     repo = ContactsRepo(client=fake_client)
     with pytest.raises(InvalidPhoneError):
         repo.get_by_phone("abc")
+
+
+def test_default_client_is_shared_across_repos(monkeypatch):
+    import supabase
+    from execution.integrations import contacts_repo
+
+    built = []
+    monkeypatch.setattr(contacts_repo, "_clients", {})
+    monkeypatch.setattr(supabase, "create_client", lambda url, key: built.append(url) or MagicMock())
+    monkeypatch.setenv("SUPABASE_URL", "https://x.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "k")
+
+    assert ContactsRepo().client is ContactsRepo().client
+    assert built == ["https://x.supabase.co"]
@@ -91,3 +91,16 @@ def test_generate_id_raises_on_empty():
     from execution.curation.id_gen import generate_id
     with pytest.raises(ValueError):
         generate_id("")
+
+
+def test_normalize_title_whitespace_only_raises_even_when_cached():
+    from execution.curation.id_gen import normalize_title
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            normalize_title("  ...  ")
+
+
+def test_normalize_title_rejects_unhashable_with_value_error():
+    from execution.curation.id_gen import normalize_title
+    with pytest.raises(ValueError):
+        normalize_title(["not", "a", "title"])
@@ -8,8 +8,10 @@ from execution.core.delivery_reporter import Contact, DeliveryReporter
 
 @pytest.fixture(autouse=True)
 def _no_real_sleep(monkeypatch):
-    """Replace time.sleep so tests don't actually wait."""
+    """Replace time.sleep so tests don't actually wait, and freeze the clock
+    so measured send time doesn't nibble at the asserted jitter values."""
     monkeypatch.setattr("execution.core.delivery_reporter.time.sleep", lambda _: None)
+    monkeypatch.setattr("execution.core.delivery_reporter.time.monotonic", lambda: 0.0)
 
 
 def test_dispatch_appends_ref_token_to_each_message(monkeypatch):
@@ -229,3 +231,121 @@ def test_delivery_summary_event_includes_throttle_metadata(monkeypatch):
     assert detail["total"] == 2
     assert "duration_seconds" in detail
     assert isinstance(detail["duration_seconds"], int)
+
+
+def test_dispatch_concurrency_sends_in_waves(monkeypatch):
+    monkeypatch.setenv("BROADCAST_CONCURRENCY", "3")
+    sleeps: list[float] = []
+    monkeypatch.setattr(
+        "execution.core.delivery_reporter.time.sleep",
+        lambda s: sleeps.append(s),
+    )
+    monkeypatch.setattr(
+        "execution.core.delivery_reporter.random.uniform", lambda lo, hi: 7.0
+    )
+    sent = []
+    reporter = DeliveryReporter(
+        workflow="t", send_fn=lambda phone, text: sent.append(phone), notify_telegram=False
+    )
+    contacts = [Contact(name=f"U{i}", phone=f"55{i:03}") for i in range(7)]
+    report = reporter.dispatch(contacts, message="hi")
+
+    assert sorted(sent) == [c.phone for c in contacts]
+    assert [r.contact.phone for r in report.results] == [c.phone for c in contacts]
+    # 7 contacts in waves of 3 → 3 waves → 2 throttle sleeps
+    assert sleeps == [7.0, 7.0]
+
+
+def test_broadcast_concurrency_defaults_and_clamps(monkeypatch):
+    from execution.core.delivery_reporter import _broadcast_concurrency
+    monkeypatch.delenv("BROADCAST_CONCURRENCY", raising=False)
+    assert _broadcast_concurrency() == 1
+    monkeypatch.setenv("BROADCAST_CONCURRENCY", "abc")
+    assert _broadcast_concurrency() == 1
+    monkeypatch.setenv("BROADCAST_CONCURRENCY", "0")
+    assert _broadcast_concurrency() == 1
+    monkeypatch.setenv("BROADCAST_CONCURRENCY", "500")
+    assert _broadcast_concurrency() == 10
+
+
+def test_dispatch_rate_limit_honors_retry_after_header(monkeypatch):
+    monkeypatch.setenv("BROADCAST_RATE_LIMIT_SLEEP", "60.0")
+    sleeps: list[float] = []
+    monkeypatch.setattr(
+        "execution.core.delivery_reporter.time.sleep",
+        lambda s: sleeps.append(s),
+    )
+    monkeypatch.setattr(
+        "execution.core.delivery_reporter.random.uniform", lambda lo, hi: 20.0
+    )
+
+    import requests
+    call = {"n": 0}
+    def send_fn(phone, text):
+        call["n"] += 1
+        if call["n"] == 1:
+            resp = MagicMock()
+            resp.status_code = 429
+            resp.text = '{"message": "rate limit exceeded"}'
+            resp.headers = {"Retry-After": "7"}
+            raise requests.HTTPError(response=resp)
+
+    reporter = DeliveryReporter(workflow="t", send_fn=send_fn, notify_telegram=False)
+    contacts = [Contact(name=f"U{i}", phone=f"55{i:03}") for i in range(2)]
+    report = reporter.dispatch(contacts, message="hi")
+
+    assert report.results[0].retry_after == 7.0
+    # Retry-After replaces the 60s default backoff; regular jitter still applies.
+    assert sleeps == [7.0, 20.0]
+
+
+def test_dispatch_subtracts_send_time_from_jitter(monkeypatch):
+    from execution.core.delivery_reporter import DeliveryResult
+    sleeps: list[float] = []
+    monkeypatch.setattr(
+        "execution.core.delivery_reporter.time.sleep",
+        lambda s: sleeps.append(s),
+    )
+    monkeypatch.setattr(
+        "execution.core.delivery_reporter.random.uniform", lambda lo, hi: 20.0
+    )
+    durations = iter([4000, 25000, 0])
+    reporter = DeliveryReporter(workflow="t", send_fn=MagicMock(), notify_telegram=False)
+    monkeypatch.setattr(
+        reporter, "_send_one",
+        lambda c, m: DeliveryResult(contact=c, success=True, error=None,
+                                    duration_ms=next(durations)),
+    )
+    contacts = [Contact(name=f"U{i}", phone=f"55{i:03}") for i in range(3)]
+    reporter.dispatch(contacts, message="hi")
+
+    # 20s budget minus 4s on the wire; a send slower than the budget → no sleep
+    assert sleeps == [16.0, 0.0]
+
+
+def test_dispatch_concurrency_halves_on_rate_limit_then_recovers(monkeypatch):
+    monkeypatch.setenv("BROADCAST_CONCURRENCY", "4")
+    import requests
+    sent: list[str] = []
+    sent_at_wave_end: list[int] = []
+    monkeypatch.setattr(
+        "execution.core.delivery_reporter.random.uniform",
+        lambda lo, hi: sent_at_wave_end.append(len(sent)) or 1.0,
+    )
+
+    def send_fn(phone, text):
+        sent.append(phone)
+        if phone == "55000":
+            resp = MagicMock()
+            resp.status_code = 429
+            resp.text = "rate limit exceeded"
+            resp.headers = {}
+            raise requests.HTTPError(response=resp)
+
+    reporter = DeliveryReporter(workflow="t", send_fn=send_fn, notify_telegram=False)
+    contacts = [Contact(name=f"U{i}", phone=f"55{i:03}") for i in range(12)]
+    report = reporter.dispatch(contacts, message="hi")
+
+    # Waves: 4 (429 → halve) → 2 → 3 → 3 remaining (cap is 4)
+    assert sent_at_wave_end == [4, 6, 9]
+    assert len(report.results) == 12
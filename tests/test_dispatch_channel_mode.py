@@ -73,3 +73,51 @@ async def test_test_send_telegram_mode_previews_to_admin(monkeypatch, mock_bot):
     assert "PREVIEW" in args[1]
     assert kwargs.get("reply_markup") is not None  # approval keyboard attached
     assert kwargs["parse_mode"] is None
+
+
+@pytest.mark.asyncio
+async def test_approval_uazapi_error_is_reported_as_plain_text(monkeypatch, mock_bot):
+    monkeypatch.setenv("CLIENT_DELIVERY_CHANNEL", "uazapi")
+    contacts_mock = AsyncMock(side_effect=RuntimeError("list_code big_news_v2 missing"))
+    with patch("dispatch.get_bot", return_value=mock_bot), \
+         patch("dispatch.get_contacts", contacts_mock):
+        from dispatch import process_approval_async
+        await process_approval_async(999, "Relatório", "draft-4")
+    edit = mock_bot.edit_message_text.await_args
+    assert "big_news_v2" in edit.args[0]
+    assert edit.kwargs["parse_mode"] is None
+
+
+@pytest.mark.asyncio
+async def test_approval_progress_edits_never_overlap_or_trail_final(monkeypatch, mock_bot):
+    import asyncio
+    monkeypatch.setenv("CLIENT_DELIVERY_CHANNEL", "uazapi")
+    edits = []
+
+    async def slow_edit(text, **kw):
+        edits.append(text)
+        if text.startswith("⏳ Enviando...\n"):
+            await asyncio.sleep(0.05)
+
+    mock_bot.edit_message_text = AsyncMock(side_effect=slow_edit)
+
+    class FakeReporter:
+        def __init__(self, **kw):
+            pass
+
+        def dispatch(self, contacts, message, on_progress):
+            # Burst of callbacks, as after a run of circuit-breaker skips.
+            for n in (10, 20, 30):
+                on_progress(n, 30, None)
+            return MagicMock(success_count=30, failure_count=0)
+
+    with patch("dispatch.get_bot", return_value=mock_bot), \
+         patch("dispatch.get_contacts", AsyncMock(return_value=[MagicMock()])), \
+         patch("dispatch.build_delivery_contact", lambda c: c), \
+         patch("dispatch.DeliveryReporter", FakeReporter):
+        from dispatch import process_approval_async
+        await process_approval_async(999, "Relatório", "draft-5")
+
+    progress = [t for t in edits if t.startswith("⏳ Enviando...\n")]
+    assert progress == ["⏳ Enviando...\n10/30 processados"]
+    assert edits[-1].startswith("✔️ Envio finalizado")
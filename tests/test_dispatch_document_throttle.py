@@ -216,3 +216,13 @@ async def test_link_mode_falls_back_to_attachment_on_storage_failure(
     assert result["sent"] == 1
     fake_uazapi.send_document.assert_called_once()
     fake_uazapi.send_message.assert_not_called()
+
+
+def test_pdf_path_reads_broadcast_concurrency(monkeypatch):
+    from webhook.dispatch_document import _broadcast_concurrency
+    monkeypatch.delenv("BROADCAST_CONCURRENCY", raising=False)
+    assert _broadcast_concurrency() == 1
+    monkeypatch.setenv("BROADCAST_CONCURRENCY", "4")
+    assert _broadcast_concurrency() == 4
+    monkeypatch.setenv("BROADCAST_CONCURRENCY", "99")
+    assert _broadcast_concurrency() == 10
@@ -0,0 +1,75 @@
+"""Tests for execution.curation.drafts_file (locked, atomic draft writes)."""
+import json
+from multiprocessing import Process
+
+
+def test_append_draft_creates_file_and_parent(tmp_path):
+    from execution.curation.drafts_file import append_draft, load_drafts
+    path = tmp_path / "data" / "news_drafts.json"
+    append_draft({"id": "draft_1"}, path=path)
+    assert load_drafts(path) == [{"id": "draft_1"}]
+
+
+def test_append_draft_keeps_json_array_for_dashboard(tmp_path):
+    from execution.curation.drafts_file import append_draft
+    path = tmp_path / "news_drafts.json"
+    append_draft({"id": "a", "ai_text": "Minério ↑"}, path=path)
+    append_draft({"id": "b"}, path=path)
+    parsed = json.loads(path.read_text(encoding="utf-8"))
+    assert [d["id"] for d in parsed] == ["a", "b"]
+    assert "Minério ↑" in path.read_text(encoding="utf-8")  # ensure_ascii=False
+
+
+def test_append_draft_keeps_file_mode(tmp_path):
+    import os
+    import stat
+    from execution.curation.drafts_file import append_draft
+    path = tmp_path / "news_drafts.json"
+    append_draft({"id": "a"}, path=path)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+    os.chmod(path, 0o664)
+    append_draft({"id": "b"}, path=path)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o664
+
+
+def test_append_draft_recovers_from_corrupt_file(tmp_path):
+    from execution.curation.drafts_file import append_draft, load_drafts
+    path = tmp_path / "news_drafts.json"
+    path.write_text("[{\"id\": \"half", encoding="utf-8")
+    append_draft({"id": "fresh"}, path=path)
+    assert load_drafts(path) == [{"id": "fresh"}]
+    # the unparseable original is kept aside, not silently overwritten
+    (kept,) = tmp_path.glob("news_drafts.json.corrupt.*")
+    assert kept.read_text(encoding="utf-8") == "[{\"id\": \"half"
+
+    # a second corrupt file gets its own copy
+    path.write_text("{broken", encoding="utf-8")
+    append_draft({"id": "again"}, path=path)
+    kept = sorted(p.read_text(encoding="utf-8") for p in tmp_path.glob("news_drafts.json.corrupt.*"))
+    assert kept == ["[{\"id\": \"half", "{broken"]
+
+
+def test_append_draft_leaves_no_temp_files(tmp_path):
+    from execution.curation.drafts_file import append_draft
+    path = tmp_path / "news_drafts.json"
+    append_draft({"id": "x"}, path=path)
+    leftovers = [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")]
+    assert leftovers == []
+
+
+def _append_many(path, prefix, n):
+    from execution.curation.drafts_file import append_draft
+    for i in range(n):
+        append_draft({"id": f"{prefix}{i}"}, path=path)
+
+
+def test_concurrent_writers_lose_no_drafts(tmp_path):
+    from execution.curation.drafts_file import load_drafts
+    path = tmp_path / "news_drafts.json"
+    procs = [Process(target=_append_many, args=(path, p, 15)) for p in ("a", "b", "c")]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(timeout=30)
+    ids = {d["id"] for d in load_drafts(path)}
+    assert len(ids) == 45
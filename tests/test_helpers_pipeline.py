@@ -46,3 +46,49 @@ async def test_run_pipeline_and_archive_skips_archive_on_pipeline_failure(mocker
 
     set_status.assert_not_called()
     discard.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_spawn_holds_task_until_done():
+    import asyncio
+    from bot.routers import _helpers
+
+    release = asyncio.Event()
+
+    async def job():
+        await release.wait()
+        return "done"
+
+    task = _helpers.spawn(job())
+    assert task in _helpers._BACKGROUND_TASKS
+    release.set()
+    assert await task == "done"
+    await asyncio.sleep(0)  # let the done-callback run
+    assert task not in _helpers._BACKGROUND_TASKS
+
+
+def test_claim_once_first_caller_wins(monkeypatch):
+    import fakeredis
+    from bot.routers import _helpers
+
+    fake = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(_helpers, "_drafts_client", lambda: fake)
+
+    assert _helpers.claim_once("approve:d1") is True
+    assert _helpers.claim_once("approve:d1") is False
+    assert _helpers.claim_once("approve:d2") is True
+    assert 0 < fake.ttl("webhook:claim:approve:d1") <= 300
+
+
+def test_preview_text_short_message_untouched():
+    from bot.routers._helpers import preview_text
+    assert preview_text("📊 *Minério* sobe") == "📊 *Minério* sobe"
+
+
+def test_preview_text_counts_emoji_as_two_units_and_cuts_at_line():
+    from bot.routers._helpers import preview_text
+    text = "\n".join(["📊 *linha* ✅"] * 400)  # 12 chars but 13 UTF-16 units per line
+    out = preview_text(text, limit=100)
+    assert len(out.encode("utf-16-le")) // 2 <= 100
+    assert out.endswith("✅")  # whole lines only — no dangling '*'
+    assert text.startswith(out)
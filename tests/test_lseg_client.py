@@ -0,0 +1,39 @@
+"""Tests for LSEGClient.get_futures_data snapshot shaping."""
+import pandas as pd
+import pytest
+
+pytest.importorskip("lseg.data")
+
+from execution.core.logger import WorkflowLogger
+from execution.integrations import lseg_client
+from execution.integrations.lseg_client import LSEGClient
+
+
+def _client():
+    client = LSEGClient.__new__(LSEGClient)
+    client.logger = WorkflowLogger("LSEGClientTest")
+    return client
+
+
+def test_get_futures_data_coalesces_price_and_fills_missing(monkeypatch):
+    df = pd.DataFrame({
+        "Instrument": ["SZZFV5", "SZZFX5", "SZZFZ5"],
+        "TRDPRC_1": [101.5, None, None],
+        "SETTLE": [100.0, 99.25, None],
+        "NETCHNG_1": [0.5, None, 1.0],
+        "PCTCHNG": [0.49, -0.1, 1.0],
+        "EXPIR_DATE": ["2025-10-31", None, "2025-12-31"],
+    }).set_index("Instrument")
+    monkeypatch.setattr(lseg_client.ld, "get_data", lambda universe, fields: df)
+
+    result = _client().get_futures_data()
+
+    assert result == [
+        {"month": "OCT/25", "price": 101.5, "change": 0.5, "pct_change": 0.49},
+        {"month": "???", "price": 99.25, "change": 0.0, "pct_change": -0.1},
+    ]
+
+
+def test_get_futures_data_empty_frame_returns_empty_list(monkeypatch):
+    monkeypatch.setattr(lseg_client.ld, "get_data", lambda universe, fields: pd.DataFrame())
+    assert _client().get_futures_data() == []
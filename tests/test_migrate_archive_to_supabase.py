@@ -24,8 +24,8 @@ def test_backfill_inserts_each_archive_item(fake_redis, monkeypatch):
     rows = []
     fake_client = MagicMock()
     fake_client.table.return_value.upsert.return_value.execute.return_value = MagicMock(data=[{"id": "ok"}])
-    def _capture(row, **kw):
-        rows.append(row)
+    def _capture(batch, **kw):
+        rows.extend(batch)
         return fake_client.table.return_value.upsert.return_value
     fake_client.table.return_value.upsert.side_effect = _capture
     monkeypatch.setattr(mig, "get_news_client", lambda: fake_client)
@@ -38,3 +38,21 @@ def test_backfill_inserts_each_archive_item(fake_redis, monkeypatch):
     assert a_row["status"] == "archived"
     assert a_row["archived_at"] == "2026-06-15T10:00:00+00:00"
     assert a_row["archived_by"] == 5
+
+
+def test_backfill_batches_upserts_and_skips_bad_payloads(fake_redis, monkeypatch):
+    from execution.scripts import migrate_archive_to_supabase as mig
+    for i in range(5):
+        fake_redis.set(f"platts:archive:2026-06-15:{i}",
+                       json.dumps({"id": str(i), "title": f"T{i}"}))
+    fake_redis.set("platts:archive:2026-06-15:bad", "not-json")
+    fake_client = MagicMock()
+    monkeypatch.setattr(mig, "get_news_client", lambda: fake_client)
+    monkeypatch.setattr(mig, "_BATCH", 2)
+
+    assert mig.backfill() == 5
+    upsert = fake_client.table.return_value.upsert
+    sent = [row["id"] for call in upsert.call_args_list for row in call.args[0]]
+    assert sorted(sent) == ["0", "1", "2", "3", "4"]
+    # 6 keys in scan batches of 2 → 3 flushes, one row shape each
+    assert upsert.call_count == 3
@@ -57,3 +57,48 @@ def test_morning_check_data_invalida_cai_pra_hoje():
     msg = build_message(_itens(), "data-quebrada")
     hoje = datetime.now(timezone(timedelta(hours=-3))).date()
     assert f"`IRON ORE · {pill_date(hoje)}`" in msg
+
+
+def test_morning_check_agrupa_secoes_em_ordem_fixa():
+    from execution.scripts.morning_check import build_message
+
+    itens = [
+        {"variable_key": "IOALE00", "product": "Alumina Diff 2.5-4%",
+         "price": 1.50, "change": 0, "changePercent": 0},
+        {"variable_key": "XXXXX00", "product": "Fora da whitelist",
+         "price": 1.00, "change": 0, "changePercent": 0},
+        {"variable_key": "IOCLS00", "product": "Lump Outright",
+         "price": 110.00, "change": 0, "changePercent": 0},
+    ] + _itens()
+
+    msg = build_message(itens, "09/07/2026")
+    assert msg.index("*FINES*") < msg.index("*LUMP AND PELLET*") < msg.index("*VIU DIFFERENTIALS*")
+    assert "Fora da whitelist" not in msg
+
+
+def test_format_line_trata_change_ausente_como_estavel():
+    from execution.scripts.morning_check import format_line
+
+    line = format_line({"product": "IO fines Fe 65%", "price": 120.0,
+                        "change": None, "changePercent": None})
+    assert line == "IO fines Fe 65%  `$120.00`  estável ·"
+
+
+def test_whitelists_de_secao_sao_disjuntas():
+    """KEY_TO_SECTION faz o bucketing numa passada só; uma chave repetida em
+    duas seções cairia silenciosamente só na última."""
+    from execution.scripts import morning_check as mc
+
+    secoes = [mc.FINES_KEYS, mc.LUMP_PELLET_KEYS, mc.VIU_KEYS, mc.FREIGHT_KEYS]
+    assert sum(len(s) for s in secoes) == len(mc.KEY_TO_SECTION)
+
+
+def test_format_line_sinal_vem_do_change():
+    from execution.scripts.morning_check import format_line
+
+    line = format_line({"product": "IO fines Fe 65%", "price": 120.0,
+                        "change": -0.3, "changePercent": 0})
+    assert "-0.30 (0.00%)" in line
+    line = format_line({"product": "IO fines Fe 65%", "price": 120.0,
+                        "change": 1.5, "changePercent": 1.25})
+    assert "+1.50 (+1.25%)" in line
@@ -0,0 +1,134 @@
+"""Tests for webhook/pipeline.call_claude request shape."""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import pipeline
+
+
+def _fake_client(text="ok"):
+    client = MagicMock()
+    client.messages.create = AsyncMock(
+        return_value=SimpleNamespace(content=[SimpleNamespace(text=text)])
+    )
+    return client
+
+
+@pytest.fixture(autouse=True)
+def _fresh_client(monkeypatch):
+    monkeypatch.setattr(pipeline, "_anthropic_client", None)
+
+
+@pytest.mark.asyncio
+async def test_call_claude_marks_system_prompt_for_caching(monkeypatch):
+    client = _fake_client("resposta")
+    monkeypatch.setattr(pipeline.anthropic, "AsyncAnthropic", lambda **kw: client)
+
+    out = await pipeline.call_claude("SYSTEM PROMPT", "user text")
+
+    assert out == "resposta"
+    kwargs = client.messages.create.call_args.kwargs
+    assert kwargs["system"] == [{
+        "type": "text",
+        "text": "SYSTEM PROMPT",
+        "cache_control": {"type": "ephemeral"},
+    }]
+    assert kwargs["messages"] == [{"role": "user", "content": "user text"}]
+
+
+@pytest.mark.asyncio
+async def test_call_claude_reuses_one_client_across_calls(monkeypatch):
+    client = _fake_client()
+    built = []
+    monkeypatch.setattr(
+        pipeline.anthropic, "AsyncAnthropic", lambda **kw: built.append(kw) or client
+    )
+
+    await pipeline.call_claude("W", "a")
+    await pipeline.call_claude("C", "b")
+
+    assert len(built) == 1
+    assert client.messages.create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_call_claude_logs_cache_usage(monkeypatch, caplog):
+    client = _fake_client()
+    client.messages.create.return_value.usage = SimpleNamespace(
+        input_tokens=40, output_tokens=900,
+        cache_read_input_tokens=4800, cache_creation_input_tokens=0,
+    )
+    monkeypatch.setattr(pipeline.anthropic, "AsyncAnthropic", lambda **kw: client)
+
+    with caplog.at_level("INFO", logger="pipeline"):
+        await pipeline.call_claude("W", "a")
+
+    assert "cache_read=4800 cache_write=0" in caplog.text
+
+
+def _scripted_claude(monkeypatch, critique):
+    calls = []
+
+    async def fake(system_prompt, user_prompt):
+        calls.append((system_prompt, user_prompt))
+        if system_prompt == pipeline.WRITER_SYSTEM:
+            return "writer draft"
+        if system_prompt == pipeline.CRITIQUE_SYSTEM:
+            return critique
+        return f"curator#{len(calls)}"
+
+    monkeypatch.setattr(pipeline, "call_claude", fake)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_speculative_curator_kept_when_critique_clean(monkeypatch):
+    monkeypatch.setenv("ENABLE_SPECULATIVE_CURATOR", "true")
+    calls = _scripted_claude(monkeypatch, "Sem correções.")
+
+    phases = []
+
+    out = await pipeline.run_3_agents("raw", on_phase_start=phases.append)
+
+    assert phases == ["Writer", "Reviewer", "Finalizer"]
+    assert len(calls) == 3
+    assert out.startswith("curator#")
+    curator_prompts = [u for s, u in calls if s == pipeline.CURATOR_SYSTEM]
+    assert len(curator_prompts) == 1
+    assert "FEEDBACK DO CRITIQUE:\n---\nSem correções.\n---" in curator_prompts[0]
+
+
+@pytest.mark.asyncio
+async def test_speculative_curator_rerun_when_critique_has_notes(monkeypatch):
+    monkeypatch.setenv("ENABLE_SPECULATIVE_CURATOR", "true")
+    calls = _scripted_claude(monkeypatch, "CORREÇÕES: título genérico")
+
+    out = await pipeline.run_3_agents("raw")
+
+    assert len(calls) == 4
+    assert out == "curator#4"
+    assert "CORREÇÕES: título genérico" in calls[-1][1]
+
+
+@pytest.mark.asyncio
+async def test_speculative_curator_failure_falls_back_to_normal_curator(monkeypatch):
+    monkeypatch.setenv("ENABLE_SPECULATIVE_CURATOR", "true")
+    calls = []
+
+    async def fake(system_prompt, user_prompt):
+        calls.append((system_prompt, user_prompt))
+        if system_prompt == pipeline.WRITER_SYSTEM:
+            return "writer draft"
+        if system_prompt == pipeline.CRITIQUE_SYSTEM:
+            return "Sem correções."
+        if len(calls) == 3:
+            raise RuntimeError("speculative call failed")
+        return "curator ok"
+
+    monkeypatch.setattr(pipeline, "call_claude", fake)
+
+    out = await pipeline.run_3_agents("raw")
+
+    assert out == "curator ok"
+    assert len(calls) == 4
@@ -0,0 +1,37 @@
+"""Tests for execution.core.retry.retry_with_backoff."""
+from unittest.mock import patch
+
+import pytest
+
+from execution.core.retry import retry_with_backoff
+
+
+def test_retry_if_false_raises_without_retrying():
+    calls = []
+
+    @retry_with_backoff(max_attempts=3, base_delay=1.0, retry_if=lambda e: False)
+    def boom():
+        calls.append(1)
+        raise ValueError("permanent")
+
+    with patch("execution.core.retry.time.sleep") as sleep:
+        with pytest.raises(ValueError):
+            boom()
+    assert len(calls) == 1
+    sleep.assert_not_called()
+
+
+def test_jitter_is_added_to_backoff_delay():
+    attempts = []
+
+    @retry_with_backoff(max_attempts=2, base_delay=2.0, jitter=1.0)
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("transient")
+        return "ok"
+
+    with patch("execution.core.retry.random.uniform", return_value=0.4), \
+         patch("execution.core.retry.time.sleep") as sleep:
+        assert flaky() == "ok"
+    sleep.assert_called_once_with(pytest.approx(2.4))
@@ -125,6 +125,20 @@ def test_get_all_status_returns_dict_keyed_by_workflow(fake_redis):
     assert result["c"] is None
 
 
+def test_get_all_status_uses_single_mget(fake_redis, monkeypatch):
+    from execution.core.state_store import record_failure, get_all_status
+    record_failure("b", summary={"total": 1, "success": 0, "failure": 1}, duration_ms=100)
+    record_failure("b", summary={"total": 1, "success": 0, "failure": 1}, duration_ms=100)
+    calls = []
+    real_mget = fake_redis.mget
+    monkeypatch.setattr(fake_redis, "mget", lambda keys: calls.append(keys) or real_mget(keys))
+    monkeypatch.setattr(fake_redis, "get", lambda *a: pytest.fail("per-key GET"))
+    result = get_all_status(["a", "b"])
+    assert len(calls) == 1
+    assert result["a"] is None
+    assert result["b"]["streak"] == 2
+
+
 def test_get_status_when_redis_unavailable_returns_none(monkeypatch):
     from execution.core import state_store
     monkeypatch.setattr(state_store, "_get_client", lambda: None)
@@ -0,0 +1,25 @@
+"""Tests for the shared TelegramClient HTTP session policy."""
+from execution.integrations import telegram_client
+
+
+def test_session_retries_only_undelivered_failures():
+    retry = telegram_client._SESSION.get_adapter("https://api.telegram.org").max_retries
+    assert retry.respect_retry_after_header is True
+    assert list(retry.status_forcelist) == [429]
+    assert retry.read == 0  # a read timeout may mean the message went out
+    # 429 on POST is retried; a 5xx is not
+    assert retry.is_retry("POST", 429, has_retry_after=True)
+    assert not retry.is_retry("POST", 502)
+
+
+def test_session_caps_retry_after_at_600s():
+    from unittest.mock import MagicMock
+
+    retry = telegram_client._SESSION.get_adapter("https://api.telegram.org").max_retries
+    response = MagicMock()
+    response.headers.get.return_value = "86400"
+    assert retry.get_retry_after(response) == 600.0
+    response.headers.get.return_value = "5"
+    assert retry.get_retry_after(response) == 5.0
+    # increment() rebuilds the Retry; the cap must survive it
+    assert isinstance(retry.new(), telegram_client._CappedRetry)
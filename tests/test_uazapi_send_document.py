@@ -26,8 +26,8 @@ def _mock_post_ok():
 
 def test_send_document_posts_expected_payload():
     client = UazapiClient()
-    with patch("execution.integrations.uazapi_client.requests.post",
-               return_value=_mock_post_ok()) as post:
+    with patch.object(client.session, "post",
+                      return_value=_mock_post_ok()) as post:
         client.send_document(
             number="5511987654321",
             file_url="https://graph-cdn.example.com/download?sig=xyz",
@@ -47,8 +47,8 @@ def test_send_document_posts_expected_payload():
 
 def test_send_document_includes_caption_when_provided():
     client = UazapiClient()
-    with patch("execution.integrations.uazapi_client.requests.post",
-               return_value=_mock_post_ok()) as post:
+    with patch.object(client.session, "post",
+                      return_value=_mock_post_ok()) as post:
         client.send_document(
             number="5511987654321",
             file_url="https://example.com/x.pdf",
@@ -61,7 +61,7 @@ def test_send_document_includes_caption_when_provided():
 
 def test_send_document_returns_json_response():
     client = UazapiClient()
-    with patch("execution.integrations.uazapi_client.requests.post",
+    with patch.object(client.session, "post",
                return_value=_mock_post_ok()):
         result = client.send_document(
             number="5511987654321",
@@ -77,8 +77,40 @@ def test_send_document_raises_on_4xx():
     bad.status_code = 400
     bad.text = '{"error":"invalid number"}'
     bad.raise_for_status.side_effect = Exception("400 Bad Request")
-    with patch("execution.integrations.uazapi_client.requests.post", return_value=bad):
+    with patch.object(client.session, "post", return_value=bad):
         with pytest.raises(Exception):
             client.send_document(
                 number="bad", file_url="x", doc_name="x.pdf",
             )
+
+
+def test_send_document_does_not_retry_permanent_4xx():
+    import requests
+
+    client = UazapiClient()
+    bad = MagicMock()
+    bad.status_code = 400
+    bad.text = '{"error":"invalid number"}'
+    bad.raise_for_status.side_effect = requests.HTTPError("400", response=bad)
+    with patch.object(client.session, "post", return_value=bad) as post, \
+         patch("execution.core.retry.time.sleep") as sleep:
+        with pytest.raises(requests.HTTPError):
+            client.send_document(number="bad", file_url="x", doc_name="x.pdf")
+    assert post.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_send_document_leaves_429_to_the_caller():
+    import requests
+
+    client = UazapiClient()
+    limited = MagicMock()
+    limited.status_code = 429
+    limited.text = '{"error":"rate limited"}'
+    limited.raise_for_status.side_effect = requests.HTTPError("429", response=limited)
+    with patch.object(client.session, "post", return_value=limited) as post, \
+         patch("execution.core.retry.time.sleep") as sleep:
+        with pytest.raises(requests.HTTPError):
+            client.send_document(number="1", file_url="x", doc_name="x.pdf")
+    assert post.call_count == 1
+    sleep.assert_not_called()
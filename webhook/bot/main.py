@@ -5,7 +5,6 @@ Run: python -m webhook.bot.main
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import os
 import sys
@@ -27,6 +26,7 @@ from bot.config import (
     WEBAPP_HOST, WEBAPP_PORT, WEBHOOK_PATH, TELEGRAM_WEBHOOK_URL,
     TELEGRAM_BOT_TOKEN, ANTHROPIC_API_KEY, UAZAPI_URL, UAZAPI_TOKEN,
 )
+from bot.middlewares.dedup import UpdateDedupMiddleware
 from bot.routers.onboarding import onboarding_router
 from bot.routers.channel_join import channel_join_router
 from bot.routers.commands import public_router, admin_router, shared_router
@@ -48,17 +48,6 @@ from routes.onedrive import setup_routes as setup_onedrive_routes
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# ── Background task tracking ──
-_background_tasks: set = set()
-
-
-def create_background_task(coro):
-    task = asyncio.create_task(coro)
-    _background_tasks.add(task)
-    task.add_done_callback(_background_tasks.discard)
-    return task
-
-
 async def on_startup(app: web.Application):
     bot = get_bot()
     dp = get_dispatcher()
@@ -92,6 +81,7 @@ async def on_shutdown(app: web.Application):
 def create_app() -> web.Application:
     # Dispatcher + routers
     dp = get_dispatcher()
+    dp.update.outer_middleware(UpdateDedupMiddleware())  # Telegram redeliveries
     dp.include_router(onboarding_router)   # /start + approval + subscription (public)
     dp.include_router(channel_join_router)  # chat_join_request do canal de clientes
     dp.include_router(public_router)        # other public commands
@@ -39,7 +39,9 @@ class RoleMiddleware(BaseMiddleware):
 
         role = get_user_role(from_user.id)
         if role not in self.allowed_roles:
-            logger.debug(f"Role '{role}' not in {self.allowed_roles} for chat_id={from_user.id}")
+            # %-style: runs for every update an admin-only router rejects, and
+            # DEBUG is off in production — skip formatting the role set.
+            logger.debug("Role '%s' not in %s for chat_id=%s", role, self.allowed_roles, from_user.id)
             return None
 
         data["user_role"] = role
@@ -0,0 +1,40 @@
+"""Drop Telegram updates that were already delivered.
+
+Telegram re-sends an update whenever it did not get a 200 in time (slow
+response, deploy restart mid-request). Handlers that kick off expensive
+work already carry their own claim, but every other handler would run
+twice. Registered as an outer middleware on dp.update so a redelivered
+update_id never reaches the routers.
+
+Usage:
+  dp.update.outer_middleware(UpdateDedupMiddleware())
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Awaitable, Callable
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from bot.routers._helpers import claim_once
+
+logger = logging.getLogger(__name__)
+
+# Telegram gives up on an update well within an hour.
+_UPDATE_TTL_SECONDS = 60 * 60
+
+
+class UpdateDedupMiddleware(BaseMiddleware):
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        update_id = getattr(event, "update_id", None)
+        if update_id is not None and not claim_once(f"update:{update_id}", ttl=_UPDATE_TTL_SECONDS):
+            logger.info("Duplicate update_id=%s dropped", update_id)
+            return None
+        return await handler(event, data)
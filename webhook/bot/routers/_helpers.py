@@ -5,6 +5,7 @@ Extracted to avoid circular imports between commands.py and callbacks.py.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import time
@@ -14,6 +15,43 @@ from bot.keyboards import build_approval_keyboard
 
 logger = logging.getLogger(__name__)
 
+# ── Background tasks ──
+# The event loop keeps only weak references to tasks, so a bare
+# asyncio.create_task() for a 20-60s agent chain can be garbage-collected
+# mid-run. Hold a strong reference until the task finishes.
+
+_BACKGROUND_TASKS: set = set()
+
+
+def spawn(coro):
+    """create_task that survives until done; the handler returns at once."""
+    task = asyncio.create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+    return task
+
+
+# ── Draft preview ──
+
+_PREVIEW_LIMIT = 3500  # leaves room for the header under Telegram's 4096
+
+
+def preview_text(text, limit=_PREVIEW_LIMIT):
+    """Trim a draft for the Telegram preview card.
+
+    Telegram counts UTF-16 code units, so every emoji in Curator output
+    costs two — slicing by str length can still overflow 4096. The cut is
+    measured in UTF-16 units and backs off to the last line break, so a
+    Markdown entity is not left open mid-line (a 400 on send).
+    """
+    encoded = text.encode("utf-16-le")
+    if len(encoded) <= limit * 2:
+        return text
+    cut = encoded[: limit * 2].decode("utf-16-le", errors="ignore")
+    newline = cut.rfind("\n")
+    return cut[:newline] if newline > 0 else cut
+
+
 # ── Persistent drafts store (Redis, 7d TTL) ──
 
 _DRAFT_KEY_PREFIX = "webhook:draft:"
@@ -54,6 +92,26 @@ def drafts_contains(draft_id):
         return False
 
 
+# ── One-shot claims (double-tap / Telegram callback retry guard) ──
+
+_CLAIM_KEY_PREFIX = "webhook:claim:"
+_CLAIM_TTL_SECONDS = 300
+
+
+def claim_once(key, ttl=_CLAIM_TTL_SECONDS):
+    """Atomic SET NX: True for the first caller within `ttl`, False after.
+
+    Guards callbacks that spawn expensive work (broadcast, agent chain)
+    against a double tap or a retried callback racing the status check.
+    Fails open on Redis errors — same trade-off as the send idempotency keys.
+    """
+    try:
+        return bool(_drafts_client().set(f"{_CLAIM_KEY_PREFIX}{key}", "1", ex=ttl, nx=True))
+    except Exception as exc:
+        logger.warning(f"claim_once({key}) failed: {exc}")
+        return True
+
+
 def drafts_update(draft_id, **fields):
     draft = drafts_get(draft_id)
     if draft is None:
@@ -120,7 +178,7 @@ async def process_news(chat_id, raw_text, progress_msg_id):
                 chat_id, progress_msg_id,
             )
 
-        display = final_message[:3500] if len(final_message) > 3500 else final_message
+        display = preview_text(final_message)
         await bot.send_message(
             chat_id,
             f"📋 *PREVIEW*\n\n{display}",
@@ -160,7 +218,7 @@ async def process_adjustment(chat_id, draft_id, feedback):
 
         await bot.edit_message_text("✅ Ajuste concluído!", chat_id=chat_id, message_id=progress_msg_id)
 
-        display = adjusted[:3500] if len(adjusted) > 3500 else adjusted
+        display = preview_text(adjusted)
         await bot.send_message(
             chat_id,
             f"📋 *PREVIEW*\n\n{display}",
@@ -169,7 +227,10 @@ async def process_adjustment(chat_id, draft_id, feedback):
         logger.info(f"Draft {draft_id} adjusted")
     except Exception as e:
         logger.error(f"Adjustment error: {e}")
-        await bot.edit_message_text(f"❌ Erro no ajuste:\n{str(e)[:500]}", chat_id=chat_id, message_id=progress_msg_id)
+        await bot.edit_message_text(
+            f"❌ Erro no ajuste:\n{str(e)[:500]}",
+            chat_id=chat_id, message_id=progress_msg_id, parse_mode=None,
+        )
 
 
 async def run_pipeline_and_archive(chat_id, raw_text, progress_msg_id, item_id):
@@ -19,7 +19,7 @@ from bot.states import AdjustDraft, RejectReason
 from bot.middlewares.auth import RoleMiddleware
 from bot.routers._helpers import (
     drafts_get, drafts_contains, drafts_update,
-    run_pipeline_and_archive,
+    run_pipeline_and_archive, spawn, claim_once,
 )
 import redis_queries
 from dispatch import process_approval_async, process_test_send_async
@@ -149,13 +149,17 @@ async def on_draft_action(query: CallbackQuery, callback_data: DraftAction):
             await query.answer("⚠️ Já processado")
             await _finalize_card(query, f"⚠️ *Já processado* ({draft['status']})")
             return
+        if not claim_once(f"approve:{draft_id}"):
+            # Still pending: the first tap owns it and will finalize the card.
+            await query.answer("⏳ Já em andamento")
+            return
         drafts_update(draft_id, status="approved")
         await query.answer("✅ Aprovado! Enviando...")
         await _finalize_card(
             query,
             f"✅ *Aprovado* em {datetime.now(timezone.utc).strftime('%H:%M')} UTC — envio em andamento",
         )
-        asyncio.create_task(
+        spawn(
             process_approval_async(chat_id, draft["message"], draft_id, draft.get("uazapi_token"), draft.get("uazapi_url"))
         )
 
@@ -170,7 +174,7 @@ async def on_draft_action(query: CallbackQuery, callback_data: DraftAction):
             query,
             f"🧪 *Teste em andamento* — {datetime.now(timezone.utc).strftime('%H:%M')} UTC",
         )
-        asyncio.create_task(
+        spawn(
             process_test_send_async(chat_id, draft_id, draft["message"], draft.get("uazapi_token"), draft.get("uazapi_url"))
         )
 
@@ -257,6 +261,9 @@ async def on_curate_action(query: CallbackQuery, callback_data: CurateAction, st
             await query.answer("⚠️ Item expirou")
             await _finalize_card(query, "⚠️ Item expirou ou já processado")
             return
+        if not claim_once(f"pipeline:{item_id}"):
+            await query.answer("⏳ Já está no Writer")
+            return
         try:
             redis_queries.mark_pipeline_processed(item_id, datetime.now(timezone.utc).strftime("%Y-%m-%d"))
         except Exception as exc:
@@ -274,7 +281,7 @@ async def on_curate_action(query: CallbackQuery, callback_data: CurateAction, st
             query,
             f"🖋️ *Enviado para o Writer*\n🕒 {datetime.now(timezone.utc).strftime('%H:%M')} UTC · 🆔 `{item_id}`",
         )
-        asyncio.create_task(run_pipeline_and_archive(chat_id, raw_text, progress.message_id, item_id))
+        spawn(run_pipeline_and_archive(chat_id, raw_text, progress.message_id, item_id))
 
     elif action == "send_raw":
         try:
@@ -298,6 +305,9 @@ async def on_curate_action(query: CallbackQuery, callback_data: CurateAction, st
         if not raw_text:
             await query.answer("⚠️ Item sem texto")
             return
+        if not claim_once(f"send_raw:{item_id}"):
+            await query.answer("⏳ Já em andamento")
+            return
         # Mark archived in Supabase + remove from Redis queue
         try:
             await asyncio.to_thread(news_repo.set_status, item_id, "archived", chat_id=chat_id)
@@ -311,7 +321,7 @@ async def on_curate_action(query: CallbackQuery, callback_data: CurateAction, st
         )
         # Build a simple message with title + text
         message = f"*{title}*\n\n{raw_text}" if title else raw_text
-        asyncio.create_task(process_approval_async(chat_id, message, item_id))
+        spawn(process_approval_async(chat_id, message, item_id))
 
 
 # ── Broadcast confirm/cancel ──
@@ -332,6 +342,9 @@ async def on_broadcast_confirm(query: CallbackQuery, callback_data: BroadcastCon
             await query.answer("❌ Draft expirou")
             await _finalize_card(query, "❌ *Draft expirado*")
             return
+        if not claim_once(f"approve:{draft_id}"):
+            await query.answer("⏳ Já em andamento")
+            return
 
         drafts_update(draft_id, status="approved")
         await query.answer("📲 Enviando...")
@@ -339,6 +352,6 @@ async def on_broadcast_confirm(query: CallbackQuery, callback_data: BroadcastCon
             query,
             f"📲 *Enviando para WhatsApp*\n🕒 {datetime.now(timezone.utc).strftime('%H:%M')} UTC",
         )
-        asyncio.create_task(
+        spawn(
             process_approval_async(chat_id, draft["message"], draft_id, draft.get("uazapi_token"), draft.get("uazapi_url"))
         )
@@ -4,7 +4,6 @@ Extracted from webhook/bot/routers/callbacks.py during Phase 2 router split.
 """
 from __future__ import annotations
 
-import asyncio
 import logging
 
 from aiogram import Router
@@ -14,6 +13,7 @@ from bot.callback_data import WorkflowRun, WorkflowList
 from bot.config import get_bot
 from bot.keyboards import build_main_menu_keyboard
 from bot.middlewares.auth import RoleMiddleware
+from bot.routers._helpers import spawn
 from workflow_trigger import (
     trigger_workflow, find_triggered_run, poll_and_update,
     _workflow_name_by_id, render_workflow_list,
@@ -70,7 +70,7 @@ async def on_workflow_run(query: CallbackQuery, callback_data: WorkflowRun):
             return
         await poll_and_update(chat_id, message_id, workflow_id, run_id)
 
-    asyncio.create_task(_track())
+    spawn(_track())
 
 
 @callbacks_workflows_router.callback_query(WorkflowList.filter())
@@ -460,7 +460,7 @@ async def _render_list_view(chat_id, page, search, message_id=None, filter="t"):
 
 async def _reprocess_item(chat_id, item_id):
     """Re-run the 3-agent pipeline on a curation item pulled from Redis."""
-    from bot.routers._helpers import find_curation_item, run_pipeline_and_archive
+    from bot.routers._helpers import find_curation_item, run_pipeline_and_archive, spawn
     bot = get_bot()
     item = await asyncio.to_thread(find_curation_item, item_id)
     if item is None:
@@ -473,4 +473,4 @@ async def _reprocess_item(chat_id, item_id):
         f"{item.get('fullText', '')}"
     )
     progress = await bot.send_message(chat_id, f"🖋️ *Reprocessando via Writer*\n🆔 `{item_id}`")
-    asyncio.create_task(run_pipeline_and_archive(chat_id, raw_text, progress.message_id, item_id))
+    spawn(run_pipeline_and_archive(chat_id, raw_text, progress.message_id, item_id))
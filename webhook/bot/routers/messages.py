@@ -16,7 +16,7 @@ from aiogram.fsm.context import FSMContext
 from bot.config import ANTHROPIC_API_KEY
 from bot.states import AdjustDraft, RejectReason, AddContact, BroadcastMessage, ReprocessItem, WriterInput
 from bot.middlewares.auth import RoleMiddleware
-from bot.routers._helpers import process_news, process_adjustment
+from bot.routers._helpers import process_news, process_adjustment, spawn, preview_text
 import contact_admin
 import redis_queries
 from execution.integrations.contacts_repo import (
@@ -129,7 +129,7 @@ async def on_broadcast_text(message: Message, state: FSMContext):
         "uazapi_url": None,
     })
 
-    preview = text[:3500] if len(text) > 3500 else text
+    preview = preview_text(text)
     keyboard = {
         "inline_keyboard": [
             [
@@ -155,7 +155,7 @@ async def on_adjust_feedback(message: Message, state: FSMContext):
         await message.answer("❌ Nenhum draft em ajuste.")
         return
     logger.info(f"Received adjustment feedback for {draft_id}")
-    asyncio.create_task(process_adjustment(message.chat.id, draft_id, message.text))
+    spawn(process_adjustment(message.chat.id, draft_id, message.text))
 
 
 @message_router.message(RejectReason.waiting_reason, F.text)
@@ -287,4 +287,4 @@ async def on_writer_text(message: Message, state: FSMContext):
     logger.info(f"Writer input from chat {chat_id} ({len(text)} chars)")
 
     progress = await message.answer("⏳ Processando com 3 agentes IA...")
-    asyncio.create_task(process_news(chat_id, text, progress.message_id))
+    spawn(process_news(chat_id, text, progress.message_id))
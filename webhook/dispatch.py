@@ -15,18 +15,28 @@ import os
 import aiohttp
 import requests
 import redis as _redis_sync
+from requests.adapters import HTTPAdapter
 from redis import asyncio as redis_async
 from aiogram.exceptions import TelegramBadRequest
 
 from bot.config import get_bot, UAZAPI_URL, UAZAPI_TOKEN
 from metrics import edit_failures
 from bot.keyboards import build_approval_keyboard
+from bot.routers._helpers import preview_text
 from execution.core.delivery_reporter import DeliveryReporter, build_delivery_contact
 from execution.integrations.contacts_repo import ContactsRepo
 
 logger = logging.getLogger(__name__)
 
 
+# ── Uazapi sync session (keep-alive — used by broadcast send_fn) ──
+# One pool per process: every contact in a broadcast (and every broadcast
+# on this webhook) reuses warm TLS connections to the Uazapi host.
+
+_uazapi_session = requests.Session()
+_uazapi_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+
 # ── Redis async client (lazy singleton) ──
 
 _redis_async_client = None
@@ -181,11 +191,13 @@ async def process_approval_async(chat_id, draft_message, draft_id, uazapi_token=
             edit_failures.labels(reason="unexpected").inc()
             logger.warning("edit_unexpected", exc_info=e)
 
+        # Per-broadcast constants: the token/url can differ per draft, but
+        # not per contact — build them once instead of on every send.
+        send_url = f"{uazapi_url or UAZAPI_URL}/send/text"
+        send_headers = {"token": uazapi_token or UAZAPI_TOKEN, "Content-Type": "application/json"}
+
         # DeliveryReporter is sync — use sync send_fn + to_thread
         def send_fn(phone, text):
-            use_token = uazapi_token or UAZAPI_TOKEN
-            use_url_val = uazapi_url or UAZAPI_URL
-
             # Idempotency: SET NX EX 86400 — same 24h window as send_whatsapp
             try:
                 r = _get_redis_sync()
@@ -200,12 +212,11 @@ async def process_approval_async(chat_id, draft_message, draft_id, uazapi_token=
             except Exception as exc:
                 logger.warning("whatsapp_idempotency_check_failed_broadcast", exc_info=exc)
 
-            headers_req = {"token": use_token, "Content-Type": "application/json"}
             payload_req = {"number": str(phone), "text": text}
-            response = requests.post(
-                f"{use_url_val}/send/text",
+            response = _uazapi_session.post(
+                send_url,
                 json=payload_req,
-                headers=headers_req,
+                headers=send_headers,
                 timeout=30,
             )
             response.raise_for_status()
@@ -213,22 +224,34 @@ async def process_approval_async(chat_id, draft_message, draft_id, uazapi_token=
 
         loop = asyncio.get_event_loop()
 
+        # At most one progress edit in flight: the send loop never waits on
+        # Telegram, edits can't land out of order, and a burst of callbacks
+        # (circuit-breaker skips) collapses instead of tripping flood control.
+        pending_edit = [None]
+
+        def _on_progress_edit_done(future):
+            # Counter increments are thread-safe; logger is too.
+            if future.cancelled():
+                return
+            e = future.exception()
+            if e is not None:
+                edit_failures.labels(reason="unexpected").inc()
+                logger.warning("progress_edit_failed", extra={"error": str(e)})
+
         def on_progress_sync(processed, total_, result):
-            if processed % 10 == 0:
-                try:
-                    future = asyncio.run_coroutine_threadsafe(
-                        bot.edit_message_text(
-                            f"⏳ Enviando...\n{processed}/{total_} processados",
-                            chat_id=chat_id, message_id=progress_msg_id,
-                        ),
-                        loop,
-                    )
-                    future.result(timeout=5)
-                except Exception as e:
-                    # Runs in worker thread — can't use TelegramBadRequest async handling here.
-                    # Counter increments are thread-safe; logger is too.
-                    edit_failures.labels(reason="unexpected").inc()
-                    logger.warning("progress_edit_failed", extra={"error": str(e)})
+            if processed % 10 != 0:
+                return
+            if pending_edit[0] is not None and not pending_edit[0].done():
+                return
+            future = asyncio.run_coroutine_threadsafe(
+                bot.edit_message_text(
+                    f"⏳ Enviando...\n{processed}/{total_} processados",
+                    chat_id=chat_id, message_id=progress_msg_id,
+                ),
+                loop,
+            )
+            future.add_done_callback(_on_progress_edit_done)
+            pending_edit[0] = future
 
         reporter = DeliveryReporter(
             workflow="webhook_approval",
@@ -241,6 +264,14 @@ async def process_approval_async(chat_id, draft_message, draft_id, uazapi_token=
             reporter.dispatch, delivery_contacts, draft_message, on_progress_sync,
         )
 
+        # Let a last in-flight counter edit land (or drop it) before the
+        # final edit, so "Enviando... N/N" can't overwrite "finalizado".
+        if pending_edit[0] is not None and not pending_edit[0].done():
+            try:
+                await asyncio.wait_for(asyncio.wrap_future(pending_edit[0]), timeout=5)
+            except Exception:
+                pending_edit[0].cancel()
+
         try:
             await bot.edit_message_text(
                 "✔️ Envio finalizado — veja resumo detalhado abaixo.",
@@ -266,9 +297,13 @@ async def process_approval_async(chat_id, draft_message, draft_id, uazapi_token=
 
     except Exception as e:
         logger.error(f"Approval processing error: {e}")
+        # Plain text: exception messages carry '_' / '*' / '[' that break the
+        # Markdown parse, and the fallback send would then fail the same way.
         error_text = f"❌ ERRO NO ENVIO\n\n{str(e)}"
         try:
-            await bot.edit_message_text(error_text, chat_id=chat_id, message_id=progress_msg_id)
+            await bot.edit_message_text(
+                error_text, chat_id=chat_id, message_id=progress_msg_id, parse_mode=None,
+            )
         except TelegramBadRequest as edit_err:
             msg = str(edit_err).lower()
             if "message is not modified" in msg:
@@ -276,11 +311,11 @@ async def process_approval_async(chat_id, draft_message, draft_id, uazapi_token=
             else:
                 edit_failures.labels(reason="bad_request").inc()
                 logger.warning("edit_failed", extra={"error": str(edit_err)})
-                await bot.send_message(chat_id, error_text)
+                await bot.send_message(chat_id, error_text, parse_mode=None)
         except Exception as edit_err:
             edit_failures.labels(reason="unexpected").inc()
             logger.warning("edit_unexpected", exc_info=edit_err)
-            await bot.send_message(chat_id, error_text)
+            await bot.send_message(chat_id, error_text, parse_mode=None)
 
 
 async def process_test_send_async(chat_id, draft_id, draft_message, uazapi_token=None, uazapi_url=None):
@@ -292,7 +327,7 @@ async def process_test_send_async(chat_id, draft_id, draft_message, uazapi_token
     from bot.routing import client_delivery_mode
     bot = get_bot()
     if client_delivery_mode() == "telegram":
-        display = draft_message[:3500] if len(draft_message) > 3500 else draft_message
+        display = preview_text(draft_message)
         try:
             await bot.send_message(
                 chat_id,
@@ -328,7 +363,7 @@ async def process_test_send_async(chat_id, draft_id, draft_message, uazapi_token
                 f"✅ Enviado para: {name} ({phone})\n\n"
                 f"Se ficou bom, clique em ✅ Aprovar para enviar a todos os {len(contacts)} contatos.",
             )
-            display = draft_message[:3500] if len(draft_message) > 3500 else draft_message
+            display = preview_text(draft_message)
             await bot.send_message(
                 chat_id,
                 f"📋 *PREVIEW*\n\n{display}",
@@ -343,4 +378,4 @@ async def process_test_send_async(chat_id, draft_id, draft_message, uazapi_token
         logger.info(f"Test send for {draft_id}: {name} ({phone})")
     except Exception as e:
         logger.error(f"Test send error: {e}")
-        await bot.send_message(chat_id, f"❌ Erro no teste:\n{str(e)[:500]}")
+        await bot.send_message(chat_id, f"❌ Erro no teste:\n{str(e)[:500]}", parse_mode=None)
@@ -28,7 +28,7 @@ from webhook.pdf_storage import upload_and_sign
 
 
 ALL_CODE = "__all__"
-CONCURRENCY = 1
+CONCURRENCY = 1                                # default when BROADCAST_CONCURRENCY is unset
 DOWNLOAD_URL_STALE_AFTER_SECONDS = 50 * 60     # 50 min safety margin on Graph's ~1h TTL
 IDEMPOTENCY_TTL_SECONDS = 24 * 3600
 
@@ -68,6 +68,16 @@ def _broadcast_delay_range() -> tuple[float, float]:
     return lo, hi
 
 
+def _broadcast_concurrency() -> int:
+    """Mirror of execution.core.delivery_reporter._broadcast_concurrency so
+    the PDF path honors the same BROADCAST_CONCURRENCY knob. Clamped [1, 10]."""
+    try:
+        value = int(os.environ.get("BROADCAST_CONCURRENCY", str(CONCURRENCY)))
+    except (TypeError, ValueError):
+        return CONCURRENCY
+    return max(1, min(value, 10))
+
+
 class ApprovalExpiredError(Exception):
     """approval:{uuid} key is missing in Redis (TTL expired or never existed)."""
 
@@ -261,7 +271,7 @@ async def dispatch_document(
         }
 
     uazapi = UazapiClient()
-    sem = asyncio.Semaphore(CONCURRENCY)
+    sem = asyncio.Semaphore(_broadcast_concurrency())
     results: dict = {"sent": 0, "failed": 0, "skipped": 0, "errors": []}
 
     async def _send_one(contact, idx, total):
@@ -11,6 +11,7 @@ All functions are async — they use anthropic.AsyncAnthropic.
 
 import asyncio
 import logging
+import os
 
 import anthropic
 
@@ -20,20 +21,52 @@ from execution.core.prompts import WRITER_SYSTEM, CRITIQUE_SYSTEM, CURATOR_SYSTE
 logger = logging.getLogger(__name__)
 
 
+_anthropic_client = None
+
+
+def _get_anthropic():
+    """Lazy singleton: one AsyncAnthropic (one connection pool) for every
+    agent call, so a Writer → Critique → Curator chain reuses the TLS
+    connection to the API instead of handshaking three times."""
+    global _anthropic_client
+    if _anthropic_client is None:
+        _anthropic_client = anthropic.AsyncAnthropic(
+            api_key=ANTHROPIC_API_KEY,
+            timeout=120.0,
+        )
+    return _anthropic_client
+
+
+def _cached_system(system_prompt: str) -> list:
+    """System prompt as a single cache-marked block.
+
+    The agent prompts are fixed and several KB each (Writer/Curator are
+    well above the minimum cacheable size), so after the first call of a
+    5-minute window Anthropic serves them from its prompt cache instead of
+    re-processing them on every Writer → Critique → Curator run.
+    """
+    return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+
 async def call_claude(system_prompt: str, user_prompt: str) -> str:
     """Call Claude API (async) and return text response."""
     logger.info(f"call_claude: system={len(system_prompt)} chars, user={len(user_prompt)} chars")
     try:
-        client = anthropic.AsyncAnthropic(
-            api_key=ANTHROPIC_API_KEY,
-            timeout=120.0,
-        )
-        message = await client.messages.create(
+        message = await _get_anthropic().messages.create(
             model="claude-sonnet-4-6",
             max_tokens=4096,
-            system=system_prompt,
+            system=_cached_system(system_prompt),
             messages=[{"role": "user", "content": user_prompt}],
         )
+        usage = getattr(message, "usage", None)
+        if usage is not None:
+            # Cache hit rate: read > 0 means the system prompt came from cache.
+            logger.info(
+                f"call_claude usage: input={usage.input_tokens} "
+                f"cache_read={getattr(usage, 'cache_read_input_tokens', 0) or 0} "
+                f"cache_write={getattr(usage, 'cache_creation_input_tokens', 0) or 0} "
+                f"output={usage.output_tokens}"
+            )
         return message.content[0].text
     except anthropic.APIConnectionError as e:
         logger.error(f"Anthropic connection error: {e}")
@@ -46,6 +79,22 @@ async def call_claude(system_prompt: str, user_prompt: str) -> str:
         raise
 
 
+# Critique's verdict when nothing needs fixing (see CRITIQUE_SYSTEM).
+_CLEAN_CRITIQUE = "Sem correções."
+
+
+def _speculative_curator_enabled() -> bool:
+    return os.environ.get("ENABLE_SPECULATIVE_CURATOR", "false").lower() == "true"
+
+
+def _is_clean_critique(critique: str) -> bool:
+    return critique.strip().rstrip(".").lower() == _CLEAN_CRITIQUE.rstrip(".").lower()
+
+
+def _curator_prompt(writer_output: str, critique_output: str, raw_text: str) -> str:
+    return f"Crie a versão final para WhatsApp.\n\nTEXTO DO WRITER:\n---\n{writer_output}\n---\n\nFEEDBACK DO CRITIQUE:\n---\n{critique_output}\n---\n\nTEXTO ORIGINAL:\n---\n{raw_text}\n---\n\nProduza APENAS a mensagem formatada."
+
+
 async def run_3_agents(raw_text: str, on_phase_start=None) -> str:
     """Run Writer -> Critique -> Curator chain. Returns final formatted message.
 
@@ -69,17 +118,39 @@ async def run_3_agents(raw_text: str, on_phase_start=None) -> str:
 
     await _notify("Reviewer")
     logger.info("Agent 2/3: Critique starting...")
-    critique_output = await call_claude(
+    critique_call = call_claude(
         CRITIQUE_SYSTEM,
         f"Revise o trabalho do Writer:\n\nTRABALHO DO WRITER:\n---\n{writer_output}\n---\n\nTEXTO ORIGINAL:\n---\n{raw_text}\n---\n\nExecute sua revisão crítica.",
     )
-    logger.info(f"Critique done ({len(critique_output)} chars)")
+    if _speculative_curator_enabled():
+        # Curator speculatively fed a clean review, alongside the real one.
+        # Kept only if Critique comes back clean — then it is exactly the
+        # prompt the sequential path would have sent.
+        # A failed speculation must not sink the run: fall through to the
+        # normal Curator. Critique's own failure still propagates.
+        critique_output, tentative = await asyncio.gather(
+            critique_call,
+            call_claude(CURATOR_SYSTEM, _curator_prompt(writer_output, _CLEAN_CRITIQUE, raw_text)),
+            return_exceptions=True,
+        )
+        if isinstance(critique_output, BaseException):
+            raise critique_output
+        logger.info(f"Critique done ({len(critique_output)} chars)")
+        if isinstance(tentative, BaseException):
+            logger.warning(f"Speculative Curator failed, running it normally: {tentative}")
+        elif _is_clean_critique(critique_output):
+            await _notify("Finalizer")
+            logger.info(f"Speculative Curator accepted ({len(tentative)} chars)")
+            return tentative
+    else:
+        critique_output = await critique_call
+        logger.info(f"Critique done ({len(critique_output)} chars)")
 
     await _notify("Finalizer")
     logger.info("Agent 3/3: Curator starting...")
     curator_output = await call_claude(
         CURATOR_SYSTEM,
-        f"Crie a versão final para WhatsApp.\n\nTEXTO DO WRITER:\n---\n{writer_output}\n---\n\nFEEDBACK DO CRITIQUE:\n---\n{critique_output}\n---\n\nTEXTO ORIGINAL:\n---\n{raw_text}\n---\n\nProduza APENAS a mensagem formatada.",
+        _curator_prompt(writer_output, critique_output, raw_text),
     )
     logger.info(f"Curator done ({len(curator_output)} chars)")
 
@@ -12,6 +12,8 @@ import asyncio
 import logging
 import os
 
+import requests
+
 from bot.config import get_bot
 from bot.callback_data import (
     ReportType as ReportTypeCB, ReportYear, ReportMonth,
@@ -220,7 +222,6 @@ async def reports_show_month_list(chat_id, message_id, report_type, year, month)
 
 def _download_report_sync(report_id):
     """Sync: query Supabase for report metadata + signed URL + PDF bytes."""
-    import requests
     sb = _get_supabase()
     if not sb:
         return None, "Supabase não configurado"